@@ -1,7 +1,11 @@
+from .imports import router as imports
+from .operations import router as operations
 from .user_auth import router as user_auth
 from .video_link import router as video_link
 
 routers = [
     (user_auth, "Authentication"),
     (video_link, "VideoLink"),
+    (imports, "Imports"),
+    (operations, "Operations"),
 ]
@@ -0,0 +1,169 @@
+import asyncio
+import shutil
+import traceback
+from typing import List
+
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from app import schema
+from app.authentication.jwt.oauth2 import get_current_stream_user, get_current_user
+from app.authentication.models import User
+from app.config import get_logger
+from app.utils import file_extension, spool_upload
+from app.utils.import_job_utils import (
+    FINISHED_STATUSES,
+    create_import_job,
+    get_import_job,
+    import_job_spool_dir,
+    new_import_job_id,
+)
+
+logger = get_logger(f"{__name__}")
+router = APIRouter()
+
+
+def _job_schema(job: dict) -> schema.ImportJob:
+    return schema.ImportJob(
+        **{
+            key: value
+            for key, value in job.items()
+            if key in schema.ImportJob.model_fields
+        },
+        filenames=[spooled["filename"] for spooled in job["files"]],
+    )
+
+
+async def _get_user_job(job_id: str, user_id: int) -> dict:
+    job = await get_import_job(job_id)
+    if not job or job["user_id"] != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found"
+        )
+    return job
+
+
+@router.post(
+    "/video-links/imports",
+    response_model=schema.ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_link_import(
+    files: List[UploadFile] = File(...),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Start a bulk import of video links from uploaded files.
+
+    The files are stored and the request returns right away with a job id.
+    An import worker parses them, drops duplicates, fetches metadata and inserts
+    the links in chunks, checkpointing after each chunk so an interrupted job
+    resumes where it stopped.
+
+    Args:
+        files (List[UploadFile]): .txt, .csv, .xlsx or .pdf files containing video links.
+        current_user (User): The currently authenticated user, injected by dependency.
+
+    Returns:
+        ImportJobResponse: The queued job; poll `/video-links/imports/{job_id}` or
+        stream `/video-links/imports/{job_id}/events` for progress.
+
+    Raises:
+        HTTPException: If a file type is unsupported or too large, or if an internal error occurs.
+    """
+    job_id = new_import_job_id()
+    spool_dir = import_job_spool_dir(job_id)
+
+    try:
+        spooled = []
+        for index, file in enumerate(files):
+            path = f"{spool_dir}/{index}.{file_extension(file.filename)}"
+            await spool_upload(file, path)
+            spooled.append({"path": path, "filename": file.filename})
+
+        job = await create_import_job(job_id, current_user.id, spooled)
+        logger.info("Import job %s queued for user %s", job_id, current_user.id)
+        return schema.ImportJobResponse(
+            version="v1",
+            status=status.HTTP_202_ACCEPTED,
+            job=_job_schema(job),
+            message="Import job queued",
+        )
+
+    except ValueError as ve:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception as e:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+        logger.error(f"Import job creation Error : {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/video-links/imports/{job_id}", response_model=schema.ImportJobResponse)
+async def get_link_import(job_id: str, current_user: User = Depends(get_current_user)):
+    """
+    Return the progress of an import job owned by the current user.
+
+    Args:
+        job_id (str): The id returned when the import was created.
+        current_user (User): The currently authenticated user, injected by dependency.
+
+    Returns:
+        ImportJobResponse: Status and link counters of the job.
+
+    Raises:
+        HTTPException: If the job does not exist or belongs to another user.
+    """
+    job = await _get_user_job(job_id, current_user.id)
+    return schema.ImportJobResponse(
+        version="v1",
+        status=status.HTTP_200_OK,
+        job=_job_schema(job),
+        message="Import job fetched successfully",
+    )
+
+
+@router.get("/video-links/imports/{job_id}/events")
+async def stream_link_import(
+    job_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_stream_user),
+):
+    """
+    Stream the progress of an import job as server-sent events.
+
+    A `progress` event carrying the job is sent whenever it changes; the stream
+    ends after the job completes or fails.
+
+    Args:
+        job_id (str): The id returned when the import was created.
+        request (Request): The incoming request, used to stop on client disconnect.
+        current_user (User): The currently authenticated user, resolved on a
+            short-lived session so no connection is held while streaming.
+
+    Raises:
+        HTTPException: If the job does not exist or belongs to another user.
+    """
+    job = await _get_user_job(job_id, current_user.id)
+
+    async def events():
+        last_update = None
+        current = job
+        while current and not await request.is_disconnected():
+            if current["updated_at"] != last_update:
+                last_update = current["updated_at"]
+                payload = _job_schema(current).model_dump_json()
+                yield f"event: progress\ndata: {payload}\n\n"
+            if current["status"] in FINISHED_STATUSES:
+                break
+            await asyncio.sleep(1)
+            current = await get_import_job(job_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
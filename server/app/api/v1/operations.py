@@ -0,0 +1,69 @@
+import traceback
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app import schema
+from app.authentication.jwt.oauth2 import get_current_operator
+from app.authentication.models import User
+from app.config import get_logger, get_pool_metrics
+from app.utils.quota_utils import get_quota_usage
+
+logger = get_logger(f"{__name__}")
+router = APIRouter()
+
+
+@router.get("/youtube/quota", response_model=schema.QuotaUsageResponse)
+async def youtube_quota(current_user: User = Depends(get_current_operator)):
+    """
+    Report today's YouTube Data API quota spend and remaining budget.
+    Only accounts listed in OPERATOR_EMAILS may call it.
+
+    Args:
+        current_user (User): The authenticated operator, injected by dependency.
+
+    Returns:
+        QuotaUsageResponse: Units spent and remaining, the low-priority reserve and rate limits.
+
+    Raises:
+        HTTPException: 403 for non-operators, 500 if the quota counters cannot be read.
+    """
+    try:
+        usage = await get_quota_usage()
+        return schema.QuotaUsageResponse(
+            version="v1", status=status.HTTP_200_OK, **usage
+        )
+    except Exception as e:
+        logger.error(f"Quota usage Error : {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/database/pool", response_model=schema.DatabasePoolMetricsResponse)
+async def database_pool_metrics(
+    pool: Literal["primary", "replica"] = Query("primary"),
+    current_user: User = Depends(get_current_operator),
+):
+    """
+    Report connection pool usage of this worker: saturation and how long
+    requests waited to check out a connection. Only accounts listed in
+    OPERATOR_EMAILS may call it.
+
+    Args:
+        pool (str): Which pool to report, the primary or the read replica.
+        current_user (User): The authenticated operator, injected by dependency.
+
+    Returns:
+        DatabasePoolMetricsResponse: Pool size, connections in use, saturation and checkout wait times.
+    """
+    metrics = get_pool_metrics(replica=pool == "replica")
+    if metrics is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No read replica is configured",
+        )
+    return schema.DatabasePoolMetricsResponse(
+        version="v1", status=status.HTTP_200_OK, **metrics
+    )
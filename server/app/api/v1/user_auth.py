@@ -8,10 +8,10 @@ from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.authentication.jwt.oauth2 import get_current_user
+from app.authentication.jwt.oauth2 import get_current_read_user, get_current_user
 from app.authentication.jwt.token import create_access_token
 from app.authentication.models import User
-from app.config import get_db, get_logger
+from app.config import get_db, get_logger, get_read_db, mark_recent_write
 from app.config.appwrite_client import AppwriteClient
 from app.repository import UserRepository
 from app.schema import ProfileResponse, Token, UploadProfile, UserRegister
@@ -69,6 +69,8 @@ async def login(
             )
 
         access_token = create_access_token(user_id=user.id)
+        # a fresh signup may still be replicating; keep the first reads on the primary
+        await mark_recent_write(user.id)
         return {"access_token": access_token, "token_type": "bearer"}
     except Exception as e:
         logger.error(f"Login Error: {e}\n{traceback.format_exc()}")
@@ -81,7 +83,8 @@ async def login(
 @router.get("/me", response_model=ProfileResponse)
 @cache_response(user_cache_key, ttl=300)
 async def me(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     repo = UserRepository(db)
     user = await repo.profile_details(current_user.id)
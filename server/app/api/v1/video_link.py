@@ -1,27 +1,47 @@
 import traceback
-from typing import List
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schema
-from app.authentication.jwt.oauth2 import get_current_user
+from app.authentication.jwt.oauth2 import get_current_read_user, get_current_user
 from app.authentication.models import User
 from app.config import (
+    conf,
     delete_cache,
     get_db,
     get_logger,
+    get_read_db,
     video_url,
     youtube_embeded,
-    youtube_key,
 )
+from app.models import EnrichmentStatus, PlaylistVisibility
 from app.repository import VideoLinkRepository
 from app.utils import (
+    build_link_payloads,
     cache_response,
+    cache_response_page,
+    canonicalize_links,
+    decode_cursor,
     download_video,
-    extract_file_link,
-    extract_youtube_link_id,
-    fetch_youtube_video_metadata,
+    encode_cursor,
+    enqueue_video_enrichment,
+    file_extension,
+    get_cached_upload_links,
+    get_video_metadata,
+    hash_upload,
+    set_cached_upload_links,
+    stream_file_links,
+)
+from app.utils.progress_utils import (
+    build_progress,
+    cache_progress,
+    forget_progress,
+    get_progress,
+    progress_entry,
+    record_many_progress,
+    record_progress,
 )
 
 logger = get_logger(f"{__name__}")
@@ -29,33 +49,42 @@ router = APIRouter()
 
 
 @router.get("/videos", response_model=schema.LinkResponse)
-@cache_response(
-    lambda current_user, **kwargs: f"user_videos:{current_user.id}", ttl=300
+@cache_response_page(
+    lambda current_user, **kwargs: f"user_videos:{current_user.id}",
+    lambda cursor=None, limit=None, **kwargs: f"{limit}:{cursor or 'first'}",
+    ttl=300,
 )
 async def get_all_links(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(conf.videos_page_size, ge=1, le=conf.videos_page_max_size),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    Retrieve all video links associated with the current authenticated user.
-    This endpoint fetches all video links stored for the user identified by the current authentication context.
-    It returns a structured response containing metadata for each video link, including title, description,
-    publication date, channel title, thumbnail URL, and embedded URL. If no links are found, an empty list is returned.
+    Retrieve the video links of the current authenticated user, one page at a time.
+    Links are returned newest first. Each page holds up to `limit` links and, if more follow,
+    a `next_cursor` to pass back as `cursor`. Pages are read with a keyset seek on
+    (uploaded_at, id), so every page costs the same regardless of library size, and each
+    page is cached separately under the user's `user_videos` hash.
 
      Args:
+        cursor (str, optional): Opaque cursor from the previous page; omit for the first page.
+        limit (int): Page size, capped at VIDEOS_PAGE_MAX_SIZE.
         current_user (User): The currently authenticated user, injected by dependency.
         db (AsyncSession): The asynchronous database session, injected by dependency.
 
     Returns:
-        LinkResponse: A response object containing the API version, status code, list of video links with metadata,
-                      the source of the links, uploader's email, and a message.
+        LinkResponse: A response object containing the API version, status code, one page of video links
+                      with metadata, the source of the links, uploader's email, the next cursor and a message.
 
     Raises:
         HTTPException:
+            - 400 Bad Request if the cursor is malformed.
             - 401 Unauthorized if the user is not authenticated.
             - 500 Internal Server Error for unexpected errors during processing.
     Note:
-        - The 'source' field in the response will be set to the unique source if all links share the same source,
-          otherwise it will be set to "mixed".
+        - The 'source' field in the response will be set to the unique source if all links of the page
+          share the same source, otherwise it will be set to "mixed".
         - All exceptions are logged for debugging purposes.
     """
     try:
@@ -68,8 +97,15 @@ async def get_all_links(
                 detail="Unauthorized access to the content",
             )
 
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as ve:
+            raise HTTPException(status_code=400, detail=str(ve))
+
         repo = VideoLinkRepository(db)
-        result = await repo.get_all_links(user_id)
+        result = await repo.get_links_page(user_id, limit + 1, after)
+        has_more = len(result) > limit
+        result = result[:limit]
 
         if not result:
             return schema.LinkResponse(
@@ -93,7 +129,6 @@ async def get_all_links(
                 etag=None,
                 id=link.id,
                 title=link.title,
-                description=link.description,
                 published_at=(
                     link.uploaded_at.isoformat() if link.uploaded_at else None
                 ),
@@ -110,15 +145,20 @@ async def get_all_links(
                 schema.VideoLinkWithMetadata(url=link.url, metadata=metadata_obj)
             )
 
+        last = result[-1]
         return schema.LinkResponse(
             version="v1",
             status=status.HTTP_200_OK,
             links=response_links,
             source=response_source,
             uploader=email,
+            next_cursor=encode_cursor(last.uploaded_at, last.id) if has_more else None,
+            has_more=has_more,
             message="Response successfully generated",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             f"Response creation Error (manual) : {e}\n{traceback.format_exc()}"
@@ -129,6 +169,103 @@ async def get_all_links(
         )
 
 
+@router.get("/videos/{video_id}", response_model=schema.VideoDetailResponse)
+async def get_video_detail(
+    video_id: int,
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Retrieve one video link of the current user with its full metadata.
+
+    List endpoints leave out the description and tags of each video; this is where
+    they are read.
+
+    Args:
+        video_id (int): The unique id of the video link.
+        current_user (User): The currently authenticated user, injected by dependency.
+        db (AsyncSession): The asynchronous database session, injected by dependency.
+
+    Returns:
+        VideoDetailResponse: The video with its description, tags and statistics.
+
+    Raises:
+        HTTPException: 404 if the user has no such link, 500 if an internal error occurs.
+    """
+    try:
+        repo = VideoLinkRepository(db)
+        link = await repo.get_link_detail(current_user.id, video_id)
+        if not link:
+            raise HTTPException(status_code=404, detail="Video not found")
+
+        return schema.VideoDetailResponse(
+            version="v1",
+            status=status.HTTP_200_OK,
+            video=schema.VideoDetail(
+                id=link.id,
+                video_id=link.video_id,
+                url=link.url,
+                source=link.source,
+                etag=link.etag,
+                title=link.title,
+                description=link.description,
+                tags=link.tags,
+                channel_title=link.channel_title,
+                thumbnail_url=link.thumbnail_url,
+                duration_seconds=link.duration_seconds,
+                view_count=link.view_count,
+                like_count=link.like_count,
+                comment_count=link.comment_count,
+                enrichment_status=(
+                    link.enrichment_status.value if link.enrichment_status else None
+                ),
+                embedded_url=f"{youtube_embeded}/{link.video_id}",
+                uploaded_at=(
+                    link.uploaded_at.isoformat() if link.uploaded_at else None
+                ),
+            ),
+            message="Video fetched successfully",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+async def _create_links(
+    repo: VideoLinkRepository,
+    user_id: int,
+    urls: List[str],
+    source: str,
+    fetch_metadata: bool = True,
+) -> list:
+    """
+    Insert links for `urls` and return only the rows created. Videos the user
+    already has are skipped by the insert itself (ON CONFLICT DO NOTHING), so
+    metadata is fetched just for the new links whose video isn't enriched yet.
+    """
+    if not urls:
+        return []
+
+    payloads = await build_link_payloads(urls, fetch_metadata=False)
+    created = await repo.create_video_link(user_id, payloads, source=source)
+
+    to_fetch = [
+        row.video_id
+        for row in created
+        if row.enrichment_status != EnrichmentStatus.ENRICHED
+    ]
+    if fetch_metadata and to_fetch:
+        metadata, not_found = await get_video_metadata(to_fetch)
+        await repo.store_video_metadata(created, metadata, not_found)
+    return created
+
+
 @router.post(
     "/video-links",
     status_code=status.HTTP_200_OK,
@@ -136,19 +273,28 @@ async def get_all_links(
 )
 async def video_links(
     data: schema.VideoLinkRegister,
+    enrichment: Literal["sync", "background"] = Query(
+        "sync", description="Fetch metadata before responding or in the background"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Handles the creation of new video links for the current user.
 
-    This endpoint receives a list of video URLs, checks for duplicates, fetches YouTube metadata for new links,
+    This endpoint receives a list of video URLs, maps each to its video id and canonical
+    `https://www.youtube.com/watch?v=<id>` URL (dropping links that are not YouTube videos),
+    checks for duplicates, fetches YouTube metadata for new links,
     and stores them in the database. If a link already exists for the user, it is skipped. For each new link,
     YouTube metadata is fetched (if possible) and included in the response. The response contains the status,
     uploader information, and details about the processed links.
 
+    With `enrichment=background` the links are stored right away with their video id only and the metadata
+    is filled in later by the enrichment worker; poll `/video-links/enrichment-status` for completion.
+
     Args:
         data (VideoLinkRegister): The payload containing a list of video URLs to register.
+        enrichment (str): "sync" (default) or "background" metadata enrichment.
         db (AsyncSession, optional): The database session dependency.
         current_user (User, optional): The currently authenticated user dependency.
 
@@ -169,15 +315,15 @@ async def video_links(
 
         repo = VideoLinkRepository(db)
 
-        unique_input_links = list(set(data.links))
-
-        existing_links = await repo.get_existing_links(
-            current_user.id, unique_input_links
+        created = await _create_links(
+            repo,
+            user_id,
+            list(canonicalize_links(data.links).values()),
+            source="manual",
+            fetch_metadata=enrichment == "sync",
         )
 
-        new_links = list(set(unique_input_links) - set(existing_links))
-
-        if not new_links:
+        if not created:
             return schema.VideoLinkResponse(
                 version="v1",
                 status=status.HTTP_200_OK,
@@ -187,51 +333,18 @@ async def video_links(
                 message="Links are Already exists",
             )
 
-        link_payloads = []
-
-        for url in new_links:
-            item: dict = {"url": url}
-
-            vid = extract_youtube_link_id(url)
-            if not vid:
-                logger.info("Could not extract video id from url: %s", url)
-                link_payloads.append(item)
-                continue
-
-            meta = None
-            try:
-                meta = fetch_youtube_video_metadata(vid, youtube_key)
-            except Exception as exc:
-                logger.error("Exception fetching metadata for %s: %s", vid, exc)
-                meta = None
-
-            if meta:
-                item.update(
-                    {
-                        "video_id": meta.get("video_id"),
-                        "title": meta.get("title"),
-                        "description": meta.get("description"),
-                        "channel_title": meta.get("channel_title"),
-                        "thumbnail_url": meta.get("thumbnail_url"),
-                        "duration_seconds": meta.get("duration_seconds"),
-                        "view_count": meta.get("view_count"),
-                        "like_count": meta.get("like_count"),
-                        "comment_count": meta.get("comment_count"),
-                        "tags": meta.get("tags"),
-                    }
-                )
-            else:
-                item.update({"video_id": vid})
-
-            link_payloads.append(item)
-
-        created = await repo.create_video_link(
-            current_user.id, link_payloads, source="manual"
-        )
-
         # deleting the cache after any updation
         await delete_cache(f"user_videos:{user_id}")
 
+        # deferred links and those whose metadata call failed are filled in later
+        await enqueue_video_enrichment(
+            [
+                row.video_id
+                for row in created
+                if row.enrichment_status == EnrichmentStatus.PENDING
+            ]
+        )
+
         response_links = []
         for created_row in created:
             vid = getattr(created_row, "video_id", None)
@@ -251,8 +364,15 @@ async def video_links(
                     embedded_url=(f"{youtube_embeded}/{vid}" if vid else None),
                 )
 
+            enrichment_status = getattr(created_row, "enrichment_status", None)
             response_links.append(
-                {"url": getattr(created_row, "url"), "metadata": metadata_obj}
+                {
+                    "url": getattr(created_row, "url"),
+                    "metadata": metadata_obj,
+                    "enrichment_status": (
+                        enrichment_status.value if enrichment_status else None
+                    ),
+                }
             )
 
         return schema.VideoLinkResponse(
@@ -261,7 +381,11 @@ async def video_links(
             links=response_links,
             source="manual",
             uploader=uploader_email,
-            message="Link has been uploaded sucessfully",
+            message=(
+                "Links accepted, metadata is being fetched in the background"
+                if defer_enrichment
+                else "Link has been uploaded sucessfully"
+            ),
         )
 
     except HTTPException:
@@ -274,6 +398,61 @@ async def video_links(
         )
 
 
+@router.get(
+    "/video-links/enrichment-status", response_model=schema.EnrichmentStatusResponse
+)
+async def get_enrichment_status(
+    ids: List[int] = Query(..., description="Ids of the links to check"),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Poll the metadata enrichment state of links added with `enrichment=background`.
+
+    Args:
+        ids (List[int]): The ids of the links returned by `/video-links`.
+        current_user (User, optional): The currently authenticated user, injected by dependency.
+        db (AsyncSession, optional): The asynchronous database session, injected by dependency.
+
+    Returns:
+        EnrichmentStatusResponse: The status of each link and whether none of them is still pending.
+
+    Raises:
+        HTTPException: If an internal server error occurs.
+    """
+    repo = VideoLinkRepository(db)
+
+    try:
+        rows = await repo.get_enrichment_status(current_user.id, ids)
+        links = [
+            schema.LinkEnrichmentStatus(
+                id=row.id,
+                url=row.url,
+                video_id=row.video_id,
+                enrichment_status=row.enrichment_status.value,
+            )
+            for row in rows
+        ]
+        completed = all(
+            row.enrichment_status != EnrichmentStatus.PENDING for row in rows
+        )
+
+        return schema.EnrichmentStatusResponse(
+            version="v1",
+            status=status.HTTP_200_OK,
+            links=links,
+            completed=completed,
+            message=("Enrichment completed" if completed else "Enrichment in progress"),
+        )
+
+    except Exception as e:
+        logger.error(f"Enrichment status Error : {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
 @router.post("/video-links/files", response_model=schema.VideoLinkFileResponse)
 async def upload_links_files(
     files: List[UploadFile] = File(...),
@@ -301,45 +480,51 @@ async def upload_links_files(
         HTTPException: If a file is too large, if link extraction fails, or if an internal error occurs.
 
     Note:
-        - Maximum allowed file size is 5 MB.
+        - Files are read in chunks. .txt and .csv uploads are parsed as they stream in
+          and may be up to UPLOAD_MAX_TEXT_FILE_SIZE (256 MB by default); .xlsx and .pdf
+          are limited to UPLOAD_MAX_FILE_SIZE (5 MB by default).
+        - Extracted links are cached by content hash, so re-uploading an identical file
+          skips parsing and only runs the duplicate check and insert.
+        - Links are de-duplicated by YouTube video id and stored in canonical form; links
+          that are not YouTube videos are dropped.
         - Only unique links not already present in the system are processed and stored.
         - YouTube metadata is fetched for each valid link, if possible.
     """
-    MAX_FILE_SIZE = 5 * 1024 * 1024
-    all_extracted_links = []
+    all_extracted_links = set()
     repo = VideoLinkRepository(db)
 
     try:
         user_id = current_user.id
         user_email = current_user.email
         for file in files:
-            file_bytes = await file.read()
-
-            if len(file_bytes) > MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=400, detail=f"File {file.filename} too large"
-                )
-
             try:
-                links = extract_file_link(file_bytes, file.filename)
+                extension = file_extension(file.filename)
+                digest = await hash_upload(file)
+                cached_links = await get_cached_upload_links(extension, digest)
+                if cached_links is not None:
+                    all_extracted_links.update(cached_links)
+                    continue
+
+                file_links = set()
+                async for link in stream_file_links(file):
+                    file_links.add(link)
+                await set_cached_upload_links(extension, digest, list(file_links))
+                all_extracted_links |= file_links
             except ValueError as ve:
                 logger.error(f"Something went wrong: {ve}\n{traceback.format_exc()}")
                 raise HTTPException(status_code=400, detail=str(ve))
 
-            if links:
-                all_extracted_links.extend(links)
-
         if not all_extracted_links:
             return {"message": "No links found in provided files", "links": []}
 
-        prepare_unique_links = list(set(all_extracted_links))
-
-        existing_links = await repo.get_existing_links(
-            current_user.id, prepare_unique_links
+        created = await _create_links(
+            repo,
+            user_id,
+            list(canonicalize_links(all_extracted_links).values()),
+            source="file",
         )
-        unique_links = list(set(prepare_unique_links) - set(existing_links))
 
-        if not unique_links:
+        if not created:
             return schema.VideoLinkFileResponse(
                 version="v1",
                 status=status.HTTP_200_OK,
@@ -349,53 +534,20 @@ async def upload_links_files(
                 message="Links already exist in the system",
             )
 
-        link_payloads = []
-
-        for url in unique_links:
-            item: dict = {"url": url}
-
-            vid = extract_youtube_link_id(url)
-            if not vid:
-                logger.info("Could not extract video id from url: %s", url)
-                link_payloads.append(item)
-                continue
-
-            meta = None
-            try:
-                meta = fetch_youtube_video_metadata(vid, youtube_key)
-            except Exception as exc:
-                logger.error("Exception fetching metadata for %s: %s", vid, exc)
-                meta = None
-
-            if meta:
-                item.update(
-                    {
-                        "video_id": meta.get("video_id"),
-                        "title": meta.get("title"),
-                        "description": meta.get("description"),
-                        "channel_title": meta.get("channel_title"),
-                        "thumbnail_url": meta.get("thumbnail_url"),
-                        "duration_seconds": meta.get("duration_seconds"),
-                        "view_count": meta.get("view_count"),
-                        "like_count": meta.get("like_count"),
-                        "comment_count": meta.get("comment_count"),
-                        "tags": meta.get("tags"),
-                    }
-                )
-            else:
-                item.update({"video_id": vid})
-
-            link_payloads.append(item)
-
-        created = await repo.create_video_link(
-            current_user.id, link_payloads, source="file"
-        )
-
         await delete_cache(f"user_videos:{user_id}")
+        await enqueue_video_enrichment(
+            [
+                row.video_id
+                for row in created
+                if row.enrichment_status == EnrichmentStatus.PENDING
+            ]
+        )
 
         response_links = []
         for created_row in created:
             vid = getattr(created_row, "video_id", None)
+            uploaded_at_obj = getattr(created_row, "uploaded_at", None)
+            uploaded_at_str = uploaded_at_obj.isoformat() if uploaded_at_obj else None
             metadata_obj = None
             if vid:
                 metadata_obj = schema.VideoMetadata(
@@ -404,7 +556,7 @@ async def upload_links_files(
                     description=getattr(created_row, "description", None),
                     channel_title=getattr(created_row, "channel_title", None),
                     thumbnail_url=getattr(created_row, "thumbnail_url", None),
-                    uploaded_at=getattr(created_row, "uploaded_at", None),
+                    uploaded_at=uploaded_at_str,
                     embedded_url=(f"{youtube_embeded}/{vid}" if vid else None),
                 )
 
@@ -421,6 +573,8 @@ async def upload_links_files(
             message="Link has been uploaded sucessfully",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Link creation Error (manual) : {e}\n{traceback.format_exc()}")
         raise HTTPException(
@@ -461,6 +615,9 @@ async def delete_video_link(
             detail="Video link not found or not owned by the user",
         )
 
+    await delete_cache(f"user_videos:{current_user.id}")
+    await forget_progress(current_user.id, id)
+
     return {
         "version": "v1",
         "status": status.HTTP_200_OK,
@@ -573,6 +730,9 @@ async def add_playlist(
             message="Video successfully added to the playlist",
         )
 
+    except PermissionError as pe:
+        logger.warning(f"Playlist add rejected: {pe}")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(pe))
     except Exception as e:
         logger.error(f"Playlist creation Error : {e}\n{traceback.format_exc()}")
         raise HTTPException(
@@ -636,13 +796,17 @@ async def change_visibility(
         )
 
 
-@router.get("/playlists/videos", response_model=schema.PlaylistWithVideosResponse)
+@router.get(
+    "/playlists/videos",
+    response_model=schema.PlaylistWithVideosResponse,
+    deprecated=True,
+)
 @cache_response(
     lambda current_user, **kwargs: f"user_playlist:{current_user.id}", ttl=300
 )
 async def get_all_user_playlist_videos(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
      Retrieve all playlists and their associated videos for the current user.
@@ -650,6 +814,8 @@ async def get_all_user_playlist_videos(
     This endpoint fetches all playlists created by the authenticated user, along with the videos contained in each playlist.
     Returns a structured response with playlist details and their videos.
 
+    Deprecated: use the paginated `/playlists` and `/playlists/{playlist_id}/videos`.
+
     Args:
         current_user (User): The currently authenticated user, injected by dependency.
         db (AsyncSession): The asynchronous database session, injected by dependency.
@@ -666,7 +832,7 @@ async def get_all_user_playlist_videos(
     playlists = await repo.get_user_playlists_with_videos(current_user.id)
     try:
         playlist_data = []
-        for pl in playlists:
+        for pl, videos in playlists:
             playlist_data.append(
                 schema.PlaylistVideos(
                     playlist_id=pl.id,
@@ -678,13 +844,12 @@ async def get_all_user_playlist_videos(
                         schema.VideoMetadata(
                             id=v.id,
                             title=v.title,
-                            description=v.description,
                             channel_title=v.channel_title,
                             thumbnail_url=v.thumbnail_url,
                             uploaded_at=v.uploaded_at.isoformat(),
                             embedded_url=f"{youtube_embeded}/{v.video_id}",
                         )
-                        for v in pl.videos
+                        for v in videos
                     ],
                 )
             )
@@ -704,15 +869,19 @@ async def get_all_user_playlist_videos(
 
 
 @router.get(
-    "/public-playlists/videos", response_model=schema.PlaylistWithVideosResponse
+    "/public-playlists/videos",
+    response_model=schema.PlaylistWithVideosResponse,
+    deprecated=True,
 )
-async def get_public_playlist(db: AsyncSession = Depends(get_db)):
+async def get_public_playlist(db: AsyncSession = Depends(get_read_db)):
     """
     Retrieve all public playlists and their associated videos for the current user.
 
     This endpoint fetches all playlists created by the authenticated user, along with the videos contained in each playlist.
     Returns a structured response with playlist details and their videos.
 
+    Deprecated: use the paginated `/public-playlists` and `/public-playlists/{playlist_id}/videos`.
+
     Args:
         db (AsyncSession): The asynchronous database session, injected by dependency.
 
@@ -733,7 +902,7 @@ async def get_public_playlist(db: AsyncSession = Depends(get_db)):
 
         playlist_data = []
 
-        for pl in public_playlist_videos:
+        for pl, videos in public_playlist_videos:
             playlist_data.append(
                 schema.PlaylistVideos(
                     playlist_id=pl.id,
@@ -745,13 +914,12 @@ async def get_public_playlist(db: AsyncSession = Depends(get_db)):
                         schema.VideoMetadata(
                             id=v.id,
                             title=v.title,
-                            description=v.description,
                             channel_title=v.channel_title,
                             thumbnail_url=v.thumbnail_url,
                             uploaded_at=v.uploaded_at.isoformat(),
                             embedded_url=f"{youtube_embeded}/{v.video_id}",
                         )
-                        for v in pl.videos
+                        for v in videos
                     ],
                 )
             )
@@ -776,6 +944,288 @@ async def get_public_playlist(db: AsyncSession = Depends(get_db)):
         )
 
 
+def _playlist_summary(playlist, preview: dict | None) -> schema.PlaylistSummary:
+    preview = preview or {}
+    return schema.PlaylistSummary(
+        playlist_id=playlist.id,
+        playlist_name=playlist.name,
+        description=playlist.description,
+        visibility=playlist.visibility.value,
+        creator_email=getattr(playlist.owner, "email", "unknown@example.com"),
+        video_count=preview.get("video_count", 0),
+        thumbnails=preview.get("thumbnails", []),
+    )
+
+
+def _decode_page_cursor(cursor: Optional[str]):
+    try:
+        return decode_cursor(cursor) if cursor else None
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+
+async def _playlist_summaries_page(
+    repo: VideoLinkRepository,
+    limit: int,
+    cursor: Optional[str],
+    user_id: Optional[int] = None,
+    visibility: Optional[PlaylistVisibility] = None,
+) -> dict:
+    playlists = await repo.get_playlists_page(
+        limit + 1, _decode_page_cursor(cursor), user_id=user_id, visibility=visibility
+    )
+    has_more = len(playlists) > limit
+    playlists = playlists[:limit]
+
+    previews = await repo.get_playlist_previews(
+        [pl.id for pl in playlists], conf.playlist_preview_thumbnails
+    )
+    last = playlists[-1] if playlists else None
+    return {
+        "playlists": [_playlist_summary(pl, previews.get(pl.id)) for pl in playlists],
+        "next_cursor": (
+            encode_cursor(last.created_at, last.id) if has_more and last else None
+        ),
+        "has_more": has_more,
+    }
+
+
+async def _playlist_videos_page(
+    repo: VideoLinkRepository, playlist, limit: int, cursor: Optional[str]
+) -> dict:
+    videos = await repo.get_playlist_videos_page(
+        playlist.id, limit + 1, _decode_page_cursor(cursor)
+    )
+    has_more = len(videos) > limit
+    videos = videos[:limit]
+
+    # the count only ships with the first page; later pages must not pay for it
+    previews = await repo.get_playlist_previews(
+        [playlist.id], conf.playlist_preview_thumbnails, counts=cursor is None
+    )
+    last = videos[-1] if videos else None
+    return {
+        "playlist": _playlist_summary(playlist, previews.get(playlist.id)),
+        "videos": [
+            schema.VideoMetadata(
+                id=v.id,
+                title=v.title,
+                channel_title=v.channel_title,
+                thumbnail_url=v.thumbnail_url,
+                uploaded_at=v.uploaded_at.isoformat() if v.uploaded_at else None,
+                embedded_url=f"{youtube_embeded}/{v.video_id}",
+            )
+            for v in videos
+        ],
+        "next_cursor": (
+            encode_cursor(last.uploaded_at, last.id) if has_more and last else None
+        ),
+        "has_more": has_more,
+    }
+
+
+@router.get("/playlists", response_model=schema.PlaylistSummaryResponse)
+async def get_user_playlists(
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(conf.playlists_page_size, ge=1, le=conf.playlists_page_max_size),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Retrieve the current user's playlists, newest first, one page at a time.
+
+    Each playlist comes as a summary with its video count and the thumbnails of its first
+    videos; fetch the videos themselves from `/playlists/{playlist_id}/videos`.
+
+    Args:
+        cursor (str, optional): Opaque cursor from the previous page; omit for the first page.
+        limit (int): Page size, capped at PLAYLISTS_PAGE_MAX_SIZE.
+        current_user (User): The currently authenticated user, injected by dependency.
+        db (AsyncSession): The asynchronous database session, injected by dependency.
+
+    Returns:
+        PlaylistSummaryResponse: One page of playlist summaries and the next cursor.
+
+    Raises:
+        HTTPException: 400 for a malformed cursor, 500 if an internal error occurs.
+    """
+    repo = VideoLinkRepository(db)
+    try:
+        page = await _playlist_summaries_page(
+            repo, limit, cursor, user_id=current_user.id
+        )
+        return schema.PlaylistSummaryResponse(
+            version="v1",
+            status=status.HTTP_200_OK,
+            message="Fetched playlists successfully",
+            **page,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get(
+    "/playlists/{playlist_id}/videos",
+    response_model=schema.PlaylistVideosPageResponse,
+)
+async def get_user_playlist_videos(
+    playlist_id: int,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(conf.videos_page_size, ge=1, le=conf.videos_page_max_size),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Retrieve one page of the videos in one of the current user's playlists,
+    in the order they were added.
+
+    Args:
+        playlist_id (int): The unique identifier of the playlist.
+        cursor (str, optional): Opaque cursor from the previous page; omit for the first page.
+        limit (int): Page size, capped at VIDEOS_PAGE_MAX_SIZE.
+        current_user (User): The currently authenticated user, injected by dependency.
+        db (AsyncSession): The asynchronous database session, injected by dependency.
+
+    Returns:
+        PlaylistVideosPageResponse: The playlist summary, one page of its videos and the next cursor.
+
+    Raises:
+        HTTPException: 404 if the playlist is not the user's, 400 for a malformed cursor,
+        500 if an internal error occurs.
+    """
+    repo = VideoLinkRepository(db)
+    try:
+        playlist = await repo.get_playlist(playlist_id, user_id=current_user.id)
+        if not playlist:
+            raise HTTPException(status_code=404, detail="Playlist not found")
+
+        page = await _playlist_videos_page(repo, playlist, limit, cursor)
+        return schema.PlaylistVideosPageResponse(
+            version="v1",
+            status=status.HTTP_200_OK,
+            message="Fetched playlist videos successfully",
+            **page,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get("/public-playlists", response_model=schema.PlaylistSummaryResponse)
+async def get_public_playlists(
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(conf.playlists_page_size, ge=1, le=conf.playlists_page_max_size),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Retrieve the public playlist feed, newest first, one page at a time.
+
+    Each playlist comes as a summary with its video count and the thumbnails of its first
+    videos, so a page costs the same however many public videos exist; fetch the videos
+    from `/public-playlists/{playlist_id}/videos`.
+
+    Args:
+        cursor (str, optional): Opaque cursor from the previous page; omit for the first page.
+        limit (int): Page size, capped at PLAYLISTS_PAGE_MAX_SIZE.
+        db (AsyncSession): The asynchronous database session, injected by dependency.
+
+    Returns:
+        PlaylistSummaryResponse: One page of public playlist summaries and the next cursor.
+
+    Raises:
+        HTTPException: 400 for a malformed cursor, 500 if an internal error occurs.
+    """
+    repo = VideoLinkRepository(db)
+    try:
+        page = await _playlist_summaries_page(
+            repo, limit, cursor, visibility=PlaylistVisibility.PUBLIC
+        )
+        return schema.PlaylistSummaryResponse(
+            version="v1",
+            status=status.HTTP_200_OK,
+            message=(
+                "Fetched public playlists successfully"
+                if page["playlists"] or cursor
+                else "No playlist is public yet"
+            ),
+            **page,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
+@router.get(
+    "/public-playlists/{playlist_id}/videos",
+    response_model=schema.PlaylistVideosPageResponse,
+)
+async def get_public_playlist_videos(
+    playlist_id: int,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    limit: int = Query(conf.videos_page_size, ge=1, le=conf.videos_page_max_size),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Retrieve one page of the videos in a public playlist, in the order they were added.
+
+    Args:
+        playlist_id (int): The unique identifier of the playlist.
+        cursor (str, optional): Opaque cursor from the previous page; omit for the first page.
+        limit (int): Page size, capped at VIDEOS_PAGE_MAX_SIZE.
+        db (AsyncSession): The asynchronous database session, injected by dependency.
+
+    Returns:
+        PlaylistVideosPageResponse: The playlist summary, one page of its videos and the next cursor.
+
+    Raises:
+        HTTPException: 404 if the playlist is not public, 400 for a malformed cursor,
+        500 if an internal error occurs.
+    """
+    repo = VideoLinkRepository(db)
+    try:
+        playlist = await repo.get_playlist(
+            playlist_id, visibility=PlaylistVisibility.PUBLIC
+        )
+        if not playlist:
+            raise HTTPException(status_code=404, detail="Playlist not found")
+
+        page = await _playlist_videos_page(repo, playlist, limit, cursor)
+        return schema.PlaylistVideosPageResponse(
+            version="v1",
+            status=status.HTTP_200_OK,
+            message="Fetched playlist videos successfully",
+            **page,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
 @router.post(
     "/videos/{videos_id}/progress", response_model=schema.ProgressTrackerResponse
 )
@@ -788,6 +1238,10 @@ async def progress_tracker(
     """
     Track progress for a specific video for the current user.
 
+    Positions are buffered in Redis and written to the database in batches by the
+    progress flush worker every PROGRESS_FLUSH_INTERVAL seconds, so a heartbeat
+    only touches the database the first time a video is seen.
+
     Args:
         data (ProgressTrackerRegister): The payload containing last watched time.
         videos_id (int): The unique identifier of the video.
@@ -809,31 +1263,37 @@ async def progress_tracker(
         )
 
     try:
-        progress = await repo.progress_tracker(
-            id=videos_id,
-            user_id=current_user.id,
-            last_watched_time=data.last_time_watched,
-        )
-
-        if not progress.id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Progress not found"
+        buffered = await get_progress(current_user.id, videos_id)
+        if buffered and buffered["duration_seconds"] is not None:
+            duration_seconds = buffered["duration_seconds"]
+        else:
+            link = await repo.get_progress_tracker(
+                user_id=current_user.id, id=videos_id
             )
+            if not link:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Progress not found"
+                )
+            duration_seconds = link.duration_seconds
+
+        progress = build_progress(data.last_time_watched, duration_seconds)
+        await record_progress(current_user.id, videos_id, progress)
 
-        duration_seconds = max(progress.duration_seconds, 1)
         completion_percentage = round(
-            (progress.last_watched_time / duration_seconds) * 100, 2
+            (progress["last_watched_time"] / max(duration_seconds or 0, 1)) * 100, 2
         )
 
         return schema.ProgressTrackerResponse(
             version="v1",
-            is_completed=progress.is_completed,
-            last_time_watched=progress.last_watched_time,
-            duration=progress.duration_seconds,
+            is_completed=progress["is_completed"],
+            last_time_watched=progress["last_watched_time"],
+            duration=duration_seconds or 0,
             completion_percentage=completion_percentage,
             message="Progress tracked set successfully",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
         raise HTTPException(
@@ -841,13 +1301,94 @@ async def progress_tracker(
         )
 
 
+@router.post("/videos/progress", response_model=schema.ProgressBatchResponse)
+async def progress_tracker_batch(
+    data: schema.ProgressBatchRegister,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Track progress for several videos of the current user in one call, e.g. when a
+    client syncs after being offline.
+
+    Ownership of the whole set is checked in one query and every position is written
+    in a single transaction; the buffered progress in Redis is updated to match.
+    Videos the user doesn't own are reported as `not_found` instead of failing the batch.
+
+    Args:
+        data (ProgressBatchRegister): The positions to record, up to PROGRESS_BATCH_MAX_ITEMS.
+        current_user (User): The currently authenticated user, injected by dependency.
+        db (AsyncSession): The asynchronous database session, injected by dependency.
+
+    Returns:
+        ProgressBatchResponse: The completion state of each video.
+
+    Raises:
+        HTTPException: 500 if an internal error occurs.
+    """
+    repo = VideoLinkRepository(db)
+    try:
+        latest = {item.video_id: item.last_time_watched for item in data.items}
+        durations = await repo.get_owned_durations(current_user.id, list(latest))
+
+        progress = {
+            video_id: build_progress(last_time, durations[video_id])
+            for video_id, last_time in latest.items()
+            if video_id in durations
+        }
+        await repo.update_progress(
+            [progress_entry(current_user.id, vid, p) for vid, p in progress.items()]
+        )
+        await record_many_progress(current_user.id, progress, dirty=False)
+
+        results = []
+        for video_id in latest:
+            if video_id not in progress:
+                results.append(
+                    schema.ProgressBatchItemResult(
+                        video_id=video_id, status="not_found"
+                    )
+                )
+                continue
+
+            item = progress[video_id]
+            duration = item["duration_seconds"] or 0
+            results.append(
+                schema.ProgressBatchItemResult(
+                    video_id=video_id,
+                    status="updated",
+                    is_completed=item["is_completed"],
+                    last_time_watched=item["last_watched_time"],
+                    duration=duration,
+                    completion_percentage=round(
+                        (item["last_watched_time"] / max(duration, 1)) * 100, 2
+                    ),
+                )
+            )
+
+        return schema.ProgressBatchResponse(
+            version="v1",
+            status=status.HTTP_200_OK,
+            results=results,
+            updated=len(progress),
+            message="Progress tracked set successfully",
+        )
+
+    except Exception as e:
+        logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal Server Error",
+        )
+
+
 @router.get(
     "/videos/{video_id}/progress", response_model=schema.ProgressTrackerResponse
 )
 async def get_progress_tracker(
     video_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Retrieve the progress tracking information for a specific video for the current user.
@@ -869,22 +1410,27 @@ async def get_progress_tracker(
         raise HTTPException(status_code=401, detail="Unauthorized Access")
 
     try:
-        get_progress = await repo.get_progress_tracker(
-            user_id=current_user.id,
-            id=video_id,
-        )
-        if not get_progress:
-            raise HTTPException(status_code=404, detail="Progress not found")
-
-        if get_progress:
-            last_time = get_progress.last_watched_time or 0
-            duration = get_progress.duration_seconds or 1
-            completion_percentage = round((last_time / duration) * 100, 2)
-            is_completed = (
-                get_progress.is_completed
-                if get_progress.is_completed is not None
-                else False
+        progress = await get_progress(current_user.id, video_id)
+        if progress is None:
+            link = await repo.get_progress_tracker(
+                user_id=current_user.id,
+                id=video_id,
+            )
+            if not link:
+                raise HTTPException(status_code=404, detail="Progress not found")
+
+            progress = build_progress(
+                link.last_watched_time or 0,
+                link.duration_seconds,
+                last_watched_at=link.last_watched_at,
+                is_completed=link.is_completed,
             )
+            await cache_progress(current_user.id, video_id, progress)
+
+        last_time = progress["last_watched_time"] or 0
+        duration = progress["duration_seconds"] or 1
+        completion_percentage = round((last_time / duration) * 100, 2)
+        is_completed = progress["is_completed"]
 
         return schema.ProgressTrackerResponse(
             version="v1",
@@ -894,6 +1440,8 @@ async def get_progress_tracker(
             completion_percentage=completion_percentage,
             message="Progress tracked retrieved successfully",
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Something went wrong: {e}\n{traceback.format_exc()}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -902,8 +1450,8 @@ async def get_progress_tracker(
 @router.get("/playlists/{playlist_id}/progress")
 async def get_playlist_progress(
     playlist_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_read_user),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Retrieve the progress tracking information for a specific playlist for the current user.
@@ -922,7 +1470,7 @@ async def get_playlist_progress(
 
     repo = VideoLinkRepository(db)
 
-    playlist = await repo.get_playlist_with_videos(
+    playlist = await repo.get_playlist_progress(
         playlist_id=playlist_id, user_id=current_user.id
     )
 
@@ -930,10 +1478,8 @@ async def get_playlist_progress(
         raise HTTPException(status_code=404, detail="Playlist not found")
 
     try:
-        total_videos = len(playlist.videos)
-        videos_completed = sum(
-            1 for v in getattr(playlist, "videos", []) if v.is_completed is True
-        )
+        total_videos = playlist.total_videos
+        videos_completed = playlist.videos_completed
 
         completion_percentage = (
             round((videos_completed / total_videos) * 100, 2)
@@ -958,7 +1504,7 @@ async def get_playlist_progress(
 @router.get("/video/download")
 async def download_yt_videos(
     video_id: str | None = Query(None),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_read_user),
 ):
     """
     Download the YT video
@@ -1,9 +1,10 @@
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.authentication.jwt.token import verify_token
-from app.config.database import get_db
+from app.config import conf
+from app.config.database import async_session_local, get_db, get_read_db
 from app.repository.user import UserRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
@@ -18,3 +19,46 @@ async def get_current_user(
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
+
+
+async def get_current_read_user(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_read_db)
+):
+    """
+    get_current_user for read-only routes: looks the user up on the session
+    from get_read_db, so the route and the auth check share one connection.
+    """
+    token_data = verify_token(token)
+    user = await UserRepository(db).find_by_id(token_data.user_id)
+    if not user:
+        # a fresh signup may not have reached the replica yet
+        async with async_session_local() as primary:
+            user = await UserRepository(primary).find_by_id(token_data.user_id)
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
+
+
+async def get_current_stream_user(token: str = Depends(oauth2_scheme)):
+    """
+    get_current_user for streaming routes: the user is looked up on a session
+    of its own, closed before the route runs, so a long-lived response doesn't
+    hold a pooled connection.
+    """
+    token_data = verify_token(token)
+    async with async_session_local() as db:
+        user = await UserRepository(db).find_by_id(token_data.user_id)
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+    return user
+
+
+async def get_current_operator(current_user=Depends(get_current_user)):
+    """
+    get_current_user restricted to the accounts listed in OPERATOR_EMAILS.
+    """
+    if (current_user.email or "").lower() not in conf.operator_emails:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Operator access required"
+        )
+    return current_user
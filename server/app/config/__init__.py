@@ -1,5 +1,20 @@
 from .appwrite_client import AppwriteClient
-from .cache import close_redis, delete_cache, get_cache, init_redis, set_cache
+from .cache import (
+    acquire_lock,
+    close_redis,
+    delete_cache,
+    delete_many_cache,
+    get_cache,
+    get_hash_cache,
+    get_many_cache,
+    get_redis,
+    init_redis,
+    pop_queue_batch,
+    push_queue,
+    set_cache,
+    set_hash_cache,
+    set_many_cache,
+)
 from .conf import (
     appwrite_apiKey,
     appwrite_bucketId,
@@ -10,5 +25,17 @@ from .conf import (
     youtube_key,
     youtube_url,
 )
-from .database import DB_URL, Base, get_db
+from .database import (
+    DB_URL,
+    Base,
+    async_read_session_local,
+    async_session_local,
+    get_db,
+    get_pool_metrics,
+    get_read_db,
+    mark_recent_write,
+    request_user_id,
+)
+from .http_client import close_http_client, get_http_client, init_http_client
 from .logger import get_logger
+from .process_pool import close_process_pool, get_process_pool, init_process_pool
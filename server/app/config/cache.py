@@ -1,4 +1,5 @@
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 
 from app.config import conf
 
@@ -40,3 +41,91 @@ async def delete_cache(key: str):
     if not redis:
         raise RuntimeError("Redis not initialized. Call init_redis() first.")
     await redis.delete(key)
+
+
+async def get_many_cache(keys: list[str]) -> list:
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    if not keys:
+        return []
+    return await redis.mget(keys)
+
+
+async def set_many_cache(mapping: dict[str, str], ttl: int = 300):
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    if not mapping:
+        return
+    async with redis.pipeline(transaction=False) as pipe:
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=ttl)
+        await pipe.execute()
+
+
+async def push_queue(name: str, values: list[str]):
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    if values:
+        await redis.rpush(name, *values)
+
+
+async def pop_queue_batch(name: str, max_items: int, timeout: int = 5) -> list[str]:
+    """
+    Block up to `timeout` seconds for the first item of the queue, then drain
+    up to `max_items` items without blocking.
+    """
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    first = await redis.blpop([name], timeout=timeout)
+    if not first:
+        return []
+    items = [first[1]]
+    if max_items > 1:
+        items.extend(await redis.lpop(name, max_items - 1) or [])
+    return items
+
+
+def get_redis() -> Redis:
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    return redis
+
+
+async def acquire_lock(key: str, ttl: int) -> bool:
+    """
+    Take a best-effort lock shared by every app worker; it expires after `ttl`.
+    """
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    return bool(await redis.set(key, "1", nx=True, ex=ttl))
+
+
+async def delete_many_cache(keys: list[str]):
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    if keys:
+        await redis.delete(*keys)
+
+
+async def get_hash_cache(key: str, field: str):
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    try:
+        return await redis.hget(key, field)
+    except ResponseError:
+        # a plain string left under the key by an older cache layout
+        await redis.delete(key)
+        return None
+
+
+async def set_hash_cache(key: str, field: str, value: str, ttl: int = 300):
+    """
+    Cache `value` under one field of a hash. The ttl applies to the whole hash,
+    so deleting `key` drops every field at once.
+    """
+    if not redis:
+        raise RuntimeError("Redis not initialized. Call init_redis() first.")
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(key, field, value)
+        pipe.expire(key, ttl)
+        await pipe.execute()
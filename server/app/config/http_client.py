@@ -0,0 +1,34 @@
+import httpx
+
+from app.config import conf
+
+http_client: httpx.AsyncClient | None = None
+
+
+async def init_http_client():
+    """Initialize the shared, connection-pooled HTTP client at app startup"""
+    global http_client
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(conf.http_timeout, connect=conf.http_connect_timeout),
+        limits=httpx.Limits(
+            max_connections=conf.http_max_connections,
+            max_keepalive_connections=conf.http_max_keepalive_connections,
+            keepalive_expiry=conf.http_keepalive_expiry,
+        ),
+    )
+
+
+async def close_http_client():
+    """Close the shared HTTP client at app shutdown"""
+    global http_client
+    if http_client:
+        await http_client.aclose()
+        http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    if not http_client:
+        raise RuntimeError(
+            "HTTP client not initialized. Call init_http_client() first."
+        )
+    return http_client
@@ -0,0 +1,32 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config import conf
+
+process_pool: ProcessPoolExecutor | None = None
+
+
+async def init_process_pool():
+    """Start the process pool used for CPU-heavy file parsing at app startup"""
+    global process_pool
+    process_pool = ProcessPoolExecutor(
+        max_workers=conf.parse_pool_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=conf.parse_pool_max_tasks_per_child,
+    )
+
+
+async def close_process_pool():
+    """Shut the process pool down at app shutdown, dropping queued work"""
+    global process_pool
+    if process_pool:
+        process_pool.shutdown(wait=False, cancel_futures=True)
+        process_pool = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    if not process_pool:
+        raise RuntimeError(
+            "Process pool not initialized. Call init_process_pool() first."
+        )
+    return process_pool
@@ -5,12 +5,28 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api import api_router
-from app.config import close_redis, init_redis
+from app.config import (
+    close_http_client,
+    close_process_pool,
+    close_redis,
+    init_http_client,
+    init_process_pool,
+    init_redis,
+)
+from app.utils.import_job_utils import check_import_spool_dir
+from app.workers import start_workers, stop_workers
 
 
 async def lifespan(app: FastAPI):
     await init_redis()
+    await check_import_spool_dir()
+    await init_http_client()
+    await init_process_pool()
+    await start_workers()
     yield
+    await stop_workers()
+    await close_process_pool()
+    await close_http_client()
     await close_redis()
 
 
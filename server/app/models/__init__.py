@@ -1 +1,2 @@
-from .models import Playlist, PlaylistVisibility, UploadedLinks
+from .constants import EnrichmentStatus, ImportJobStatus
+from .models import Playlist, PlaylistVisibility, UploadedLinks, Video
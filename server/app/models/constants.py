@@ -4,3 +4,17 @@ import enum
 class PlaylistVisibility(enum.Enum):
     PUBLIC = "public"
     PRIVATE = "private"
+
+
+class EnrichmentStatus(enum.Enum):
+    PENDING = "pending"
+    ENRICHED = "enriched"
+    FAILED = "failed"
+
+
+class ImportJobStatus(enum.Enum):
+    QUEUED = "queued"
+    PARSING = "parsing"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
@@ -2,46 +2,109 @@ import enum
 from datetime import datetime, timezone
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from app.config import Base
-from app.models.constants import PlaylistVisibility
+from app.models.constants import EnrichmentStatus, PlaylistVisibility
 
 
-class UploadedLinks(Base):
-    __tablename__ = "uploaded_links"
+class Video(Base):
+    """
+    Global catalog of YouTube video metadata, stored once per video_id and
+    shared by every user's UploadedLinks row pointing at it.
+    """
 
-    id = Column(Integer, primary_key=True, index=True)
-    url = Column(String, nullable=False)
-    video_id = Column(String(11), nullable=False, index=True)
+    __tablename__ = "videos"
+
+    video_id = Column(String(11), primary_key=True)
+    etag = Column(String, nullable=True)
     title = Column(String, nullable=True)
     description = Column(Text, nullable=True)
     channel_title = Column(String, nullable=True)
     thumbnail_url = Column(String, nullable=True)
-    duration_seconds = Column(Integer, nullable=True)
-    view_count = Column(Integer, nullable=True)
-    like_count = Column(Integer, nullable=True)
-    comment_count = Column(Integer, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+    view_count = Column(BigInteger, nullable=True)
+    like_count = Column(BigInteger, nullable=True)
+    comment_count = Column(BigInteger, nullable=True)
     tags = Column(Text, nullable=True)
+    enrichment_status = Column(
+        Enum(EnrichmentStatus), default=EnrichmentStatus.PENDING, nullable=False
+    )
+    stats_refreshed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+    links = relationship("UploadedLinks", back_populates="video")
+
+    def __repr__(self):
+        return f"<Video(video_id='{self.video_id}', title='{self.title}')>"
+
+
+class UploadedLinks(Base):
+    __tablename__ = "uploaded_links"
+    __table_args__ = (
+        Index("uq_uploaded_links_user_video", "user_id", "video_id", unique=True),
+        Index("ix_uploaded_links_user_uploaded_at", "user_id", "uploaded_at", "id"),
+        Index(
+            "ix_uploaded_links_playlist_user",
+            "playlist_id",
+            "user_id",
+            postgresql_where=text("playlist_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_uploaded_links_playlist_uploaded_at",
+            "playlist_id",
+            "uploaded_at",
+            "id",
+            postgresql_where=text("playlist_id IS NOT NULL"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, nullable=False)
+    video_id = Column(
+        String(11), ForeignKey("videos.video_id"), nullable=False, index=True
+    )
     source = Column(String, default="manual")
     last_watched_time = Column(Float, nullable=True)
-    duration_seconds = Column(Float, nullable=True)
+    last_watched_at = Column(DateTime, nullable=True)
     is_completed = Column(Boolean, default=False)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     playlist_id = Column(Integer, ForeignKey("playlist.id"), nullable=True)
     uploaded_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     uploader = relationship("User", back_populates="uploaded_links")
     playlist = relationship("Playlist", back_populates="videos")
+    video = relationship("Video", back_populates="links", lazy="joined", innerjoin=True)
+
+    # metadata lives on the shared catalog row, read through the joined Video
+    etag = association_proxy("video", "etag")
+    title = association_proxy("video", "title")
+    description = association_proxy("video", "description")
+    channel_title = association_proxy("video", "channel_title")
+    thumbnail_url = association_proxy("video", "thumbnail_url")
+    duration_seconds = association_proxy("video", "duration_seconds")
+    view_count = association_proxy("video", "view_count")
+    like_count = association_proxy("video", "like_count")
+    comment_count = association_proxy("video", "comment_count")
+    tags = association_proxy("video", "tags")
+    enrichment_status = association_proxy("video", "enrichment_status")
 
     def __repr__(self):
         return f"<UploadedLink(id={self.id}, video_id='{self.video_id}', user_id={self.user_id})>"
@@ -49,6 +112,15 @@ class UploadedLinks(Base):
 
 class Playlist(Base):
     __tablename__ = "playlist"
+    __table_args__ = (
+        Index("ix_playlist_user_id", "user_id", "id"),
+        Index(
+            "ix_playlist_public_created_at",
+            "created_at",
+            "id",
+            postgresql_where=text("visibility = 'PUBLIC'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(Text, nullable=False)
@@ -64,5 +136,9 @@ class Playlist(Base):
 
     visibility = Column(Enum(PlaylistVisibility), default=PlaylistVisibility.PRIVATE)
 
+    # kept in step with uploaded_links when PLAYLIST_PROGRESS_COUNTERS is on
+    total_videos = Column(Integer, nullable=False, default=0, server_default="0")
+    videos_completed = Column(Integer, nullable=False, default=0, server_default="0")
+
     videos = relationship("UploadedLinks", back_populates="playlist")
     owner = relationship("User", back_populates="playlists")
@@ -1,21 +1,159 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import joinedload
 
-from app.config import get_logger
-from app.models import Playlist, PlaylistVisibility, UploadedLinks
+from app.authentication.models import User
+from app.config import conf, get_logger
+from app.models import (
+    EnrichmentStatus,
+    Playlist,
+    PlaylistVisibility,
+    UploadedLinks,
+    Video,
+)
 
 logger = get_logger(f"{__name__}")
 
+# rows per multi-row INSERT, well below asyncpg's 32767 bind parameter limit
+INSERT_CHUNK_SIZE = 1000
+
+VIDEO_CATALOG_FIELDS = (
+    "etag",
+    "title",
+    "description",
+    "channel_title",
+    "thumbnail_url",
+    "duration_seconds",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "tags",
+)
+
+# what list endpoints render per link; description and tags are left to the
+# detail query so list pages never ship the catalog's large Text columns
+LINK_LIST_COLUMNS = (
+    UploadedLinks.id,
+    UploadedLinks.url,
+    UploadedLinks.video_id,
+    UploadedLinks.source,
+    UploadedLinks.playlist_id,
+    UploadedLinks.uploaded_at,
+    Video.title,
+    Video.channel_title,
+    Video.thumbnail_url,
+    Video.duration_seconds,
+    Video.enrichment_status,
+)
+
+
+def _link_list_query():
+    return select(*LINK_LIST_COLUMNS).join(
+        Video, Video.video_id == UploadedLinks.video_id
+    )
+
 
 class VideoLinkRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def upsert_videos(self, videos: Optional[List[dict]]) -> Dict[str, dict]:
+        """
+        Insert or update rows of the shared `videos` catalog.
+        Each dict needs a 'video_id'; missing metadata never overwrites what the
+        catalog already holds. Does not commit.
+        Returns the stored catalog rows, `{video_id: {column: value}}`.
+        Rows are deduped and written in video_id order, so concurrent upserts
+        lock catalog rows in the same order and cannot deadlock each other.
+        """
+        rows = {}
+        for data in videos or []:
+            video_id = data.get("video_id")
+            if video_id:
+                rows[video_id] = {
+                    "video_id": video_id,
+                    **{field: data.get(field) for field in VIDEO_CATALOG_FIELDS},
+                    "enrichment_status": data.get("enrichment_status")
+                    or (
+                        EnrichmentStatus.ENRICHED
+                        if data.get("title")
+                        else EnrichmentStatus.PENDING
+                    ),
+                }
+
+        if not rows:
+            return {}
+
+        now = datetime.utcnow().replace(tzinfo=None)
+        rows = [
+            {**rows[video_id], "created_at": now, "updated_at": now}
+            for video_id in sorted(rows)
+        ]
+        stored = {}
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            result = await self.db.execute(
+                self._upsert_videos_statement(
+                    rows[start : start + INSERT_CHUNK_SIZE], now
+                )
+            )
+            stored.update({row["video_id"]: dict(row) for row in result.mappings()})
+        return stored
+
+    @staticmethod
+    def _upsert_videos_statement(rows: List[dict], now: datetime):
+        stmt = pg_insert(Video).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Video.video_id],
+            set_={
+                **{
+                    field: func.coalesce(
+                        getattr(stmt.excluded, field), getattr(Video, field)
+                    )
+                    for field in VIDEO_CATALOG_FIELDS
+                },
+                # an enriched row is never downgraded by a bare re-insert
+                "enrichment_status": case(
+                    (
+                        and_(
+                            Video.enrichment_status == EnrichmentStatus.ENRICHED,
+                            stmt.excluded.enrichment_status
+                            != EnrichmentStatus.ENRICHED,
+                        ),
+                        Video.enrichment_status,
+                    ),
+                    else_=stmt.excluded.enrichment_status,
+                ),
+                "updated_at": now,
+            },
+        )
+        return stmt.returning(*Video.__table__.columns)
+
     async def create_video_link(
         self,
         user_id: int,
@@ -25,36 +163,53 @@ class VideoLinkRepository:
         """
         Insert UploadedLinks rows. All metadata fields are optional.
         Expect each entry in `links` to be a dict having at least 'url' and optionally many other keys.
+        Metadata is stored once per video in the `videos` catalog, not on the link row.
+        Rows go in with multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING`
+        statements of up to INSERT_CHUNK_SIZE rows, so videos the user already has
+        are skipped atomically and only the newly created links are returned. They
+        are built from the returned rows and the upserted catalog rows, without
+        reading them back.
         """
 
         now = datetime.utcnow().replace(tzinfo=None)
         created = []
         try:
+            catalog = {
+                video_id: Video(**row)
+                for video_id, row in (await self.upsert_videos(links)).items()
+            }
+
+            # one row per (user_id, video_id), in key order, so concurrent
+            # inserts lock the unique index in the same order
+            rows = {}
             for data in links or []:
-                new = UploadedLinks(
-                    url=data.get("url"),
-                    video_id=data.get("video_id"),
-                    title=data.get("title"),
-                    description=data.get("description"),
-                    channel_title=data.get("channel_title"),
-                    thumbnail_url=data.get("thumbnail_url"),
-                    duration_seconds=data.get("duration_seconds"),
-                    view_count=data.get("view_count"),
-                    like_count=data.get("like_count"),
-                    comment_count=data.get("comment_count"),
-                    tags=data.get("tags"),
-                    source=source,
-                    user_id=user_id,
-                    uploaded_at=now,
+                rows.setdefault(
+                    data.get("video_id"),
+                    {
+                        "url": data.get("url"),
+                        "video_id": data.get("video_id"),
+                        "source": source,
+                        "user_id": user_id,
+                        "uploaded_at": now,
+                    },
+                )
+            rows = [rows[video_id] for video_id in sorted(rows)]
+            for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                result = await self.db.execute(
+                    pg_insert(UploadedLinks)
+                    .values(rows[start : start + INSERT_CHUNK_SIZE])
+                    .on_conflict_do_nothing(
+                        index_elements=[UploadedLinks.user_id, UploadedLinks.video_id]
+                    )
+                    .returning(*UploadedLinks.__table__.columns)
                 )
-                self.db.add(new)
-                created.append(new)
+                for row in result.mappings():
+                    link = UploadedLinks(**row)
+                    link.video = catalog.get(row["video_id"])
+                    created.append(link)
 
             await self.db.commit()
 
-            for item in created:
-                await self.db.refresh(item)
-
             return created
 
         except SQLAlchemyError as e:
@@ -67,41 +222,270 @@ class VideoLinkRepository:
             logger.error("Unexpected DB error: %s", e)
             raise
 
-    async def get_existing_links(
+    async def store_video_metadata(
         self,
-        user_id: int,
-        links: Optional[List[str]],
-    ) -> List[str]:
+        links: List[UploadedLinks],
+        metadata: Dict[str, dict],
+        not_found: List[str],
+    ):
+        """
+        Save fetched metadata to the catalog, mark `not_found` videos FAILED and
+        attach the stored catalog rows to `links`, e.g. the rows returned by
+        `create_video_link`.
+        """
+        try:
+            stored = await self.upsert_videos(
+                [
+                    {**meta, "enrichment_status": EnrichmentStatus.ENRICHED}
+                    for meta in metadata.values()
+                ]
+                + [
+                    {"video_id": vid, "enrichment_status": EnrichmentStatus.FAILED}
+                    for vid in not_found
+                ]
+            )
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"DB Error: (store_video_metadata): {e}")
+            raise
+
+        for link in links:
+            if link.video_id in stored:
+                link.video = Video(**stored[link.video_id])
+
+    async def get_unenriched_video_ids(self, video_ids: List[str]) -> List[str]:
         """
-        Returns a list of URLs that already exist in DB for the given user.
+        Return the subset of `video_ids` whose catalog row is not enriched yet.
         """
-        if not links:
+        if not video_ids:
             return []
 
         try:
-            query = select(UploadedLinks.url).where(
-                UploadedLinks.user_id == user_id, UploadedLinks.url.in_(links)
+            query = select(Video.video_id).where(
+                Video.video_id.in_(video_ids),
+                Video.enrichment_status != EnrichmentStatus.ENRICHED,
             )
+            result = await self.db.execute(query)
+            return [row[0] for row in result.all()]
+        except Exception as e:
+            logger.error(f"DB Error: (get_unenriched_video_ids): {e}")
+            raise
+
+    async def get_video_owner_ids(self, video_ids: List[str]) -> List[int]:
+        """
+        Return the ids of every user holding a link to one of `video_ids`.
+        """
+        if not video_ids:
+            return []
 
+        try:
+            query = (
+                select(UploadedLinks.user_id)
+                .where(UploadedLinks.video_id.in_(video_ids))
+                .distinct()
+            )
             result = await self.db.execute(query)
-            existing_links = [row[0] for row in result.all()]
-            return existing_links
+            return [row[0] for row in result.all()]
+        except Exception as e:
+            logger.error(f"DB Error: (get_video_owner_ids): {e}")
+            raise
 
+    async def get_enrichment_status(self, user_id: int, ids: List[int]):
+        """
+        Return `(id, url, video_id, enrichment_status)` rows for the user's links.
+        """
+        try:
+            query = (
+                select(
+                    UploadedLinks.id,
+                    UploadedLinks.url,
+                    UploadedLinks.video_id,
+                    Video.enrichment_status,
+                )
+                .join(Video, Video.video_id == UploadedLinks.video_id)
+                .where(UploadedLinks.user_id == user_id, UploadedLinks.id.in_(ids))
+            )
+            result = await self.db.execute(query)
+            return result.all()
         except Exception as e:
-            logger.error(f"DB Error: (get_existing_links): {e}")
+            logger.error(f"DB Error: (get_enrichment_status): {e}")
             raise
 
-    async def get_all_links(self, user_id: int) -> List[UploadedLinks]:
+    async def get_videos_due_for_stats_refresh(
+        self, limit: int, refreshed_before: datetime
+    ) -> List[str]:
         """
-        Return all the links related to the user
+        Return up to `limit` enriched video ids whose statistics are older than
+        `refreshed_before`. Videos in public playlists come first, then the most
+        recently watched ones, then the ones refreshed longest ago.
         """
         try:
-            query = select(UploadedLinks).where(UploadedLinks.user_id == user_id)
+            in_public_playlist = func.bool_or(Playlist.id.is_not(None))
+            query = (
+                select(Video.video_id)
+                .join(UploadedLinks, UploadedLinks.video_id == Video.video_id)
+                .outerjoin(
+                    Playlist,
+                    and_(
+                        Playlist.id == UploadedLinks.playlist_id,
+                        Playlist.visibility == PlaylistVisibility.PUBLIC,
+                    ),
+                )
+                .where(
+                    Video.enrichment_status == EnrichmentStatus.ENRICHED,
+                    or_(
+                        Video.stats_refreshed_at.is_(None),
+                        Video.stats_refreshed_at < refreshed_before,
+                    ),
+                )
+                .group_by(Video.video_id)
+                .order_by(
+                    in_public_playlist.desc(),
+                    func.max(UploadedLinks.last_watched_at).desc().nulls_last(),
+                    Video.stats_refreshed_at.asc().nulls_first(),
+                )
+                .limit(limit)
+            )
             result = await self.db.execute(query)
-            all_links = result.scalars().all()
-            return all_links
+            return [row[0] for row in result.all()]
         except Exception as e:
-            logger.error(f"DB Error: (get_all_links): {e}")
+            logger.error(f"DB Error: (get_videos_due_for_stats_refresh): {e}")
+            raise
+
+    async def update_video_stats(
+        self, video_ids: List[str], stats: Dict[str, dict]
+    ) -> List[str]:
+        """
+        Apply refreshed statistics for the checked `video_ids`.
+
+        Only catalog rows whose counts actually differ are rewritten, in a single
+        `UPDATE ... FROM (VALUES ...)`; the other checked rows just get their
+        `stats_refreshed_at` bumped. Returns the ids whose stats changed.
+        """
+        if not video_ids:
+            return []
+
+        now = datetime.utcnow().replace(tzinfo=None)
+        try:
+            changed = []
+            if stats:
+                fresh = (
+                    values(
+                        column("video_id", String),
+                        column("view_count", BigInteger),
+                        column("like_count", BigInteger),
+                        column("comment_count", BigInteger),
+                        name="fresh",
+                    )
+                    .data(
+                        [
+                            (
+                                vid,
+                                row.get("view_count"),
+                                row.get("like_count"),
+                                row.get("comment_count"),
+                            )
+                            for vid, row in stats.items()
+                        ]
+                    )
+                    .alias("fresh")
+                )
+                # NULL-only columns in VALUES are typed as text, hence the casts
+                view_count = cast(fresh.c.view_count, BigInteger)
+                like_count = cast(fresh.c.like_count, BigInteger)
+                comment_count = cast(fresh.c.comment_count, BigInteger)
+                stmt = (
+                    update(Video)
+                    .where(
+                        Video.video_id == fresh.c.video_id,
+                        or_(
+                            Video.view_count.is_distinct_from(view_count),
+                            Video.like_count.is_distinct_from(like_count),
+                            Video.comment_count.is_distinct_from(comment_count),
+                        ),
+                    )
+                    .values(
+                        view_count=view_count,
+                        like_count=like_count,
+                        comment_count=comment_count,
+                        stats_refreshed_at=now,
+                    )
+                    .returning(Video.video_id)
+                    .execution_options(synchronize_session=False)
+                )
+                result = await self.db.execute(stmt)
+                changed = [row[0] for row in result.all()]
+
+            changed_ids = set(changed)
+            unchanged = [vid for vid in video_ids if vid not in changed_ids]
+            if unchanged:
+                await self.db.execute(
+                    update(Video)
+                    .where(Video.video_id.in_(unchanged))
+                    .values(stats_refreshed_at=now, updated_at=Video.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+
+            await self.db.commit()
+            return changed
+
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"DB Error: (update_video_stats): {e}")
+            raise
+
+    async def get_links_page(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Row]:
+        """
+        Return up to `limit` links of the user as LINK_LIST_COLUMNS rows, newest
+        first, ordered by (uploaded_at, id). `after` is the sort key of the last
+        link of the previous page; the seek predicate keeps every page an index
+        range scan.
+        """
+        try:
+            query = _link_list_query().where(UploadedLinks.user_id == user_id)
+            if after:
+                query = query.where(
+                    tuple_(UploadedLinks.uploaded_at, UploadedLinks.id)
+                    < tuple_(literal(after[0]), literal(after[1]))
+                )
+            query = query.order_by(
+                UploadedLinks.uploaded_at.desc(), UploadedLinks.id.desc()
+            ).limit(limit)
+
+            result = await self.db.execute(query)
+            return result.all()
+        except Exception as e:
+            logger.error(f"DB Error: (get_links_page): {e}")
+            raise
+
+    async def get_existing_video_ids(
+        self,
+        user_id: int,
+        video_ids: Optional[List[str]],
+    ) -> List[str]:
+        """
+        Returns the video ids the given user already has a link for.
+        """
+        if not video_ids:
+            return []
+
+        try:
+            query = select(UploadedLinks.video_id).where(
+                UploadedLinks.user_id == user_id,
+                UploadedLinks.video_id.in_(video_ids),
+            )
+
+            result = await self.db.execute(query)
+            return [row[0] for row in result.all()]
+
+        except Exception as e:
+            logger.error(f"DB Error: (get_existing_video_ids): {e}")
             raise
 
     async def delete_links(self, user_id: int, id: int) -> bool:
@@ -109,11 +493,17 @@ class VideoLinkRepository:
         Delete the link with a specific ID belonging to the given user.
         """
         try:
-            link = await self.db.get(UploadedLinks, id)
+            link = await self.db.get(
+                UploadedLinks, id, with_for_update={"of": UploadedLinks}
+            )
 
             if not link or link.user_id != user_id:
                 return False
 
+            if link.playlist_id is not None:
+                await self._shift_playlist_counters(
+                    {link.playlist_id: (-1, -int(bool(link.is_completed)))}
+                )
             await self.db.delete(link)
             await self.db.commit()
             return True
@@ -158,16 +548,33 @@ class VideoLinkRepository:
     ) -> UploadedLinks:
         """
         Update a video to assign it to a playlist.
-        Ensures the video belongs to the user for security.
+        Ensures both the video and the playlist belong to the user.
         """
         try:
-            video = await self.db.get(UploadedLinks, video_id)
+            video = await self.db.get(
+                UploadedLinks, video_id, with_for_update={"of": UploadedLinks}
+            )
             if not video:
                 raise ValueError("Video not found")
 
             if video.user_id != user_id:
                 raise PermissionError("User does not own this video")
 
+            playlist = await self.db.scalar(
+                select(Playlist.id).where(
+                    Playlist.id == playlist_id, Playlist.user_id == user_id
+                )
+            )
+            if playlist is None:
+                raise PermissionError("User does not own this playlist")
+
+            if video.playlist_id != playlist_id:
+                completed = int(bool(video.is_completed))
+                deltas = {playlist_id: (1, completed)}
+                if video.playlist_id is not None:
+                    deltas[video.playlist_id] = (-1, -completed)
+                await self._shift_playlist_counters(deltas)
+
             # Assign playlist_id to video
             video.playlist_id = playlist_id
             await self.db.commit()
@@ -242,69 +649,364 @@ class VideoLinkRepository:
             logger.error(f"Unexpected error (change_visibility): {e}")
             raise
 
-    async def get_user_playlists_with_videos(self, user_id: int):
-        """Return all playlists with their videos for a given user."""
+    async def get_playlist_video_rows(
+        self, playlist_ids: List[int]
+    ) -> Dict[int, List[Row]]:
+        """
+        Return `{playlist_id: [LINK_LIST_COLUMNS row, ...]}` for the given
+        playlists, each in the order the videos were added.
+        """
+        if not playlist_ids:
+            return {}
+
+        try:
+            query = (
+                _link_list_query()
+                .where(UploadedLinks.playlist_id.in_(playlist_ids))
+                .order_by(UploadedLinks.uploaded_at, UploadedLinks.id)
+            )
+            result = await self.db.execute(query)
+
+            videos = {}
+            for row in result.all():
+                videos.setdefault(row.playlist_id, []).append(row)
+            return videos
+        except Exception as e:
+            logger.error(f"DB Error (get_playlist_video_rows): {e}")
+            raise
+
+    async def get_user_playlists_with_videos(
+        self, user_id: int
+    ) -> List[Tuple[Playlist, List[Row]]]:
+        """
+        Return all playlists of a given user, each paired with its video rows.
+        """
         try:
             query = (
                 select(Playlist)
                 .where(Playlist.user_id == user_id)
-                .options(selectinload(Playlist.videos))
+                .options(joinedload(Playlist.owner).load_only(User.email))
             )
             result = await self.db.execute(query)
-            return result.scalars().all()
+            playlists = result.scalars().all()
+
+            videos = await self.get_playlist_video_rows([pl.id for pl in playlists])
+            return [(pl, videos.get(pl.id, [])) for pl in playlists]
         except Exception as e:
             logger.error(f"DB Error (get_user_playlists_with_videos): {e}")
             raise
 
-    async def get_all_public_playlist_with_videos(self, visibility="None"):
+    async def get_all_public_playlist_with_videos(
+        self, visibility="None"
+    ) -> List[Tuple[Playlist, List[Row]]]:
         """
-        Get all public playlist.
+        Get all public playlist, each paired with its video rows.
         """
         try:
             query = (
                 select(Playlist)
                 .where(Playlist.visibility == PlaylistVisibility(visibility))
-                .options(selectinload(Playlist.videos), joinedload(Playlist.owner))
+                .options(joinedload(Playlist.owner).load_only(User.email))
             )
+            result = await self.db.execute(query)
+            playlists = result.scalars().all()
+
+            videos = await self.get_playlist_video_rows([pl.id for pl in playlists])
+            return [(pl, videos.get(pl.id, [])) for pl in playlists]
+        except Exception as e:
+            logger.error(f"DB Error (get_all_public_playlist_with_videos): {e}")
+            raise
+
+    async def get_playlists_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        user_id: Optional[int] = None,
+        visibility: Optional[PlaylistVisibility] = None,
+    ) -> List[Playlist]:
+        """
+        Return up to `limit` playlists, newest first, ordered by (created_at, id),
+        filtered by owner and/or visibility. Videos are not loaded; use
+        `get_playlist_previews` for the per-playlist summary.
+        """
+        try:
+            query = select(Playlist).options(
+                joinedload(Playlist.owner).load_only(User.email)
+            )
+            if user_id is not None:
+                query = query.where(Playlist.user_id == user_id)
+            if visibility is not None:
+                query = query.where(Playlist.visibility == visibility)
+            if after:
+                query = query.where(
+                    tuple_(Playlist.created_at, Playlist.id)
+                    < tuple_(literal(after[0]), literal(after[1]))
+                )
+            query = query.order_by(
+                Playlist.created_at.desc(), Playlist.id.desc()
+            ).limit(limit)
+
             result = await self.db.execute(query)
             return result.scalars().all()
         except Exception as e:
-            logger.error(f"DB Error (get_user_playlists_with_videos): {e}")
+            logger.error(f"DB Error (get_playlists_page): {e}")
+            raise
+
+    async def get_playlist_previews(
+        self, playlist_ids: List[int], thumbnails: int, counts: bool = True
+    ) -> Dict[int, dict]:
+        """
+        Return `{playlist_id: {"video_count": int | None, "thumbnails": [url, ...]}}`
+        with the latest `thumbnails` thumbnails of each playlist.
+
+        The thumbnails come from a LATERAL subquery per playlist that walks the
+        `(playlist_id, uploaded_at, id)` index and stops after `thumbnails` rows.
+        Counts are read from the maintained playlist counters when they are
+        enabled, otherwise from one grouped `count(*)`; with `counts=False`
+        they are skipped and `video_count` is None.
+        """
+        if not playlist_ids:
+            return {}
+
+        try:
+            latest = (
+                select(
+                    Video.thumbnail_url,
+                    UploadedLinks.uploaded_at,
+                    UploadedLinks.id.label("link_id"),
+                )
+                .select_from(UploadedLinks)
+                .join(Video, Video.video_id == UploadedLinks.video_id)
+                .where(UploadedLinks.playlist_id == Playlist.id)
+                .order_by(UploadedLinks.uploaded_at.desc(), UploadedLinks.id.desc())
+                .limit(max(thumbnails, 0))
+                .lateral("latest")
+            )
+            query = (
+                select(Playlist.id, Playlist.total_videos, latest.c.thumbnail_url)
+                .select_from(Playlist)
+                .outerjoin(latest, true())
+                .where(Playlist.id.in_(playlist_ids))
+                .order_by(
+                    Playlist.id, latest.c.uploaded_at.desc(), latest.c.link_id.desc()
+                )
+            )
+            result = await self.db.execute(query)
+
+            previews = {}
+            for row in result.all():
+                preview = previews.setdefault(
+                    row.id,
+                    {
+                        "video_count": (
+                            row.total_videos
+                            if counts and conf.playlist_progress_counters
+                            else None
+                        ),
+                        "thumbnails": [],
+                    },
+                )
+                if row.thumbnail_url:
+                    preview["thumbnails"].append(row.thumbnail_url)
+
+            if counts and not conf.playlist_progress_counters:
+                for preview in previews.values():
+                    preview["video_count"] = 0
+                result = await self.db.execute(
+                    select(UploadedLinks.playlist_id, func.count())
+                    .where(UploadedLinks.playlist_id.in_(playlist_ids))
+                    .group_by(UploadedLinks.playlist_id)
+                )
+                for playlist_id, video_count in result.all():
+                    previews[playlist_id]["video_count"] = video_count
+            return previews
+        except Exception as e:
+            logger.error(f"DB Error (get_playlist_previews): {e}")
             raise
 
-    async def progress_tracker(
+    async def get_playlist(
         self,
-        id: int,
-        user_id: int,
-        last_watched_time: float,
-    ):
+        playlist_id: int,
+        user_id: Optional[int] = None,
+        visibility: Optional[PlaylistVisibility] = None,
+    ) -> Optional[Playlist]:
         """
-        Get video progress related data from user
+        Return a playlist with its owner but without its videos, if it matches
+        the given owner and/or visibility.
         """
         try:
-            video = await self.db.get(UploadedLinks, id)
-            if not video:
-                raise ValueError("Video not found")
+            query = (
+                select(Playlist)
+                .options(joinedload(Playlist.owner).load_only(User.email))
+                .where(Playlist.id == playlist_id)
+            )
+            if user_id is not None:
+                query = query.where(Playlist.user_id == user_id)
+            if visibility is not None:
+                query = query.where(Playlist.visibility == visibility)
 
-            if video.user_id != user_id:
-                raise PermissionError("Unauthorized access")
+            result = await self.db.execute(query)
+            return result.scalars().first()
+        except Exception as e:
+            logger.error(f"DB Error (get_playlist): {e}")
+            raise
 
-            video.is_completed = last_watched_time >= video.duration_seconds
+    async def get_playlist_videos_page(
+        self,
+        playlist_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Row]:
+        """
+        Return up to `limit` videos of a playlist as LINK_LIST_COLUMNS rows in
+        the order they were added, by (uploaded_at, id). `after` is the sort key
+        of the last video of the previous page.
+        """
+        try:
+            query = _link_list_query().where(UploadedLinks.playlist_id == playlist_id)
+            if after:
+                query = query.where(
+                    tuple_(UploadedLinks.uploaded_at, UploadedLinks.id)
+                    > tuple_(literal(after[0]), literal(after[1]))
+                )
+            query = query.order_by(UploadedLinks.uploaded_at, UploadedLinks.id).limit(
+                limit
+            )
+
+            result = await self.db.execute(query)
+            return result.all()
+        except Exception as e:
+            logger.error(f"DB Error (get_playlist_videos_page): {e}")
+            raise
+
+    async def update_progress(self, entries: List[dict]) -> int:
+        """
+        Persist buffered watch progress in one `UPDATE ... FROM (VALUES ...)`.
+        Each entry needs 'id', 'user_id', 'last_watched_time', 'is_completed'
+        and 'last_watched_at'; a row already holding a newer position is left
+        alone. With playlist progress counters on, `videos_completed` of the
+        affected playlists is adjusted in the same transaction. Returns the
+        number of rows updated.
+        """
+        if not entries:
+            return 0
+
+        try:
+            previous = {}
+            if conf.playlist_progress_counters:
+                # lock the rows first so the completion flips below are exact
+                result = await self.db.execute(
+                    select(UploadedLinks.id, UploadedLinks.is_completed)
+                    .where(UploadedLinks.id.in_([e["id"] for e in entries]))
+                    .order_by(UploadedLinks.id)
+                    .with_for_update()
+                )
+                previous = {row.id: bool(row.is_completed) for row in result.all()}
+
+            progress = (
+                values(
+                    column("id", Integer),
+                    column("user_id", Integer),
+                    column("last_watched_time", Float),
+                    column("is_completed", Boolean),
+                    column("last_watched_at", DateTime),
+                    name="progress",
+                )
+                .data(
+                    [
+                        (
+                            e["id"],
+                            e["user_id"],
+                            e["last_watched_time"],
+                            e["is_completed"],
+                            e["last_watched_at"],
+                        )
+                        for e in entries
+                    ]
+                )
+                .alias("progress")
+            )
+            stmt = (
+                update(UploadedLinks)
+                .where(
+                    UploadedLinks.id == progress.c.id,
+                    UploadedLinks.user_id == progress.c.user_id,
+                    or_(
+                        UploadedLinks.last_watched_at.is_(None),
+                        UploadedLinks.last_watched_at <= progress.c.last_watched_at,
+                    ),
+                )
+                .values(
+                    last_watched_time=progress.c.last_watched_time,
+                    is_completed=progress.c.is_completed,
+                    last_watched_at=progress.c.last_watched_at,
+                )
+                .returning(
+                    UploadedLinks.id,
+                    UploadedLinks.playlist_id,
+                    UploadedLinks.is_completed,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.db.execute(stmt)
+            updated = result.all()
 
-            video.last_watched_time = last_watched_time
+            if previous:
+                deltas = {}
+                for row in updated:
+                    flip = int(bool(row.is_completed)) - int(
+                        previous.get(row.id, False)
+                    )
+                    if row.playlist_id is not None and flip:
+                        total, completed = deltas.get(row.playlist_id, (0, 0))
+                        deltas[row.playlist_id] = (total, completed + flip)
+                await self._shift_playlist_counters(deltas)
 
             await self.db.commit()
-            await self.db.refresh(video)
-            return video
+            return len(updated)
 
         except SQLAlchemyError as e:
             await self.db.rollback()
-            logger.error(f"DB Error: (add_video_to_playlist): {e}")
+            logger.error(f"DB Error: (update_progress): {e}")
+            raise
+
+    async def get_link_detail(self, user_id: int, id: int) -> Optional[UploadedLinks]:
+        """
+        Return one link of the user with its full catalog row, including the
+        description and tags that list queries leave out.
+        """
+        try:
+            query = select(UploadedLinks).where(
+                UploadedLinks.id == id, UploadedLinks.user_id == user_id
+            )
+            result = await self.db.execute(query)
+            return result.scalars().first()
+
+        except Exception as e:
+            logger.error(f"DB Error (get_link_detail): {e}")
             raise
 
+    async def get_owned_durations(
+        self, user_id: int, ids: List[int]
+    ) -> Dict[int, Optional[float]]:
+        """
+        Return `{link_id: duration_seconds}` for the given link ids the user
+        owns; ids of other users' or missing links are left out.
+        """
+        if not ids:
+            return {}
+
+        try:
+            query = (
+                select(UploadedLinks.id, Video.duration_seconds)
+                .join(Video, Video.video_id == UploadedLinks.video_id)
+                .where(UploadedLinks.user_id == user_id, UploadedLinks.id.in_(ids))
+            )
+            result = await self.db.execute(query)
+            return {row.id: row.duration_seconds for row in result.all()}
+
         except Exception as e:
-            await self.db.rollback()
-            logger.error(f"Unexpected error in add_video_to_playlist: {e}")
+            logger.error(f"DB Error (get_owned_durations): {e}")
             raise
 
     async def get_progress_tracker(self, user_id: int, id: int):
@@ -319,25 +1021,112 @@ class VideoLinkRepository:
             logger.error(f"DB Error (get_progress_tracker): {e}")
             raise
 
-    async def get_playlist_with_videos(
-        self,
-        user_id: int,
-        playlist_id: int,
-    ):
+    async def get_playlist_progress(self, user_id: int, playlist_id: int):
         """
-        Return the playlist data by its id
+        Return `(id, name, total_videos, videos_completed)` of the user's
+        playlist, or None. Read from the maintained counters when
+        PLAYLIST_PROGRESS_COUNTERS is on, else counted in one aggregate query.
         """
         try:
-            query = (
-                select(Playlist)
-                .where(
-                    Playlist.user_id == user_id,
-                    Playlist.id == playlist_id,
+            if conf.playlist_progress_counters:
+                query = select(
+                    Playlist.id,
+                    Playlist.name,
+                    Playlist.total_videos,
+                    Playlist.videos_completed,
                 )
-                .options(selectinload(Playlist.videos))
-            )
+            else:
+                query = (
+                    select(
+                        Playlist.id,
+                        Playlist.name,
+                        func.count(UploadedLinks.id).label("total_videos"),
+                        func.count(UploadedLinks.id)
+                        .filter(UploadedLinks.is_completed.is_(True))
+                        .label("videos_completed"),
+                    )
+                    .outerjoin(UploadedLinks, UploadedLinks.playlist_id == Playlist.id)
+                    .group_by(Playlist.id)
+                )
+            query = query.where(Playlist.user_id == user_id, Playlist.id == playlist_id)
+
             result = await self.db.execute(query)
-            return result.scalars().first()
+            return result.first()
         except Exception as e:
-            logger.error(f"DB Error (get_playlist_with_videos): {e}")
+            logger.error(f"DB Error (get_playlist_progress): {e}")
+            raise
+
+    async def _shift_playlist_counters(self, deltas: Dict[int, Tuple[int, int]]):
+        """
+        Add `(total_videos, videos_completed)` deltas to playlists in the
+        current transaction; the caller commits. No-op unless
+        PLAYLIST_PROGRESS_COUNTERS is on.
+        """
+        deltas = {pid: d for pid, d in deltas.items() if any(d)}
+        if not conf.playlist_progress_counters or not deltas:
+            return
+
+        shift = (
+            values(
+                column("id", Integer),
+                column("total_videos", Integer),
+                column("videos_completed", Integer),
+                name="shift",
+            )
+            .data(
+                [(pid, total, completed) for pid, (total, completed) in deltas.items()]
+            )
+            .alias("shift")
+        )
+        await self.db.execute(
+            update(Playlist)
+            .where(Playlist.id == shift.c.id)
+            .values(
+                total_videos=Playlist.total_videos + shift.c.total_videos,
+                videos_completed=Playlist.videos_completed + shift.c.videos_completed,
+                updated_at=Playlist.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def recount_playlist_progress(self) -> int:
+        """
+        Recompute the progress counters of every playlist from uploaded_links.
+        Returns the number of playlists updated.
+        """
+        try:
+            counts = (
+                select(
+                    Playlist.id.label("playlist_id"),
+                    func.count(UploadedLinks.id).label("total_videos"),
+                    func.count(UploadedLinks.id)
+                    .filter(UploadedLinks.is_completed.is_(True))
+                    .label("videos_completed"),
+                )
+                .outerjoin(UploadedLinks, UploadedLinks.playlist_id == Playlist.id)
+                .group_by(Playlist.id)
+                .subquery()
+            )
+            result = await self.db.execute(
+                update(Playlist)
+                .where(
+                    Playlist.id == counts.c.playlist_id,
+                    or_(
+                        Playlist.total_videos != counts.c.total_videos,
+                        Playlist.videos_completed != counts.c.videos_completed,
+                    ),
+                )
+                .values(
+                    total_videos=counts.c.total_videos,
+                    videos_completed=counts.c.videos_completed,
+                    updated_at=Playlist.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            return result.rowcount
+
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"DB Error: (recount_playlist_progress): {e}")
             raise
@@ -1,3 +1,5 @@
+from .import_schema import ImportJob, ImportJobResponse
+from .operations_schema import DatabasePoolMetricsResponse, QuotaUsageResponse
 from .user_schema import (
     Login,
     ProfileResponse,
@@ -9,15 +11,26 @@ from .user_schema import (
 from .video_link_schema import (
     AddVideoToPlaylistResponse,
     DefaultResponse,
+    EnrichmentStatusResponse,
+    LinkEnrichmentStatus,
     LinkResponse,
     PlaylistAddLinks,
     PlaylistCreationResponse,
     PlaylistProgressTrackerResponse,
     PlaylistRegister,
+    PlaylistSummary,
+    PlaylistSummaryResponse,
     PlaylistVideos,
+    PlaylistVideosPageResponse,
     PlaylistWithVideosResponse,
+    ProgressBatchItem,
+    ProgressBatchItemResult,
+    ProgressBatchRegister,
+    ProgressBatchResponse,
     ProgressTrackerRegister,
     ProgressTrackerResponse,
+    VideoDetail,
+    VideoDetailResponse,
     VideoLinkFileResponse,
     VideoLinkRegister,
     VideoLinkResponse,
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ImportJob(BaseModel):
+    """
+    Progress of a bulk link import job.
+    """
+
+    job_id: str = Field(..., description="The unique id of the import job")
+    status: str = Field(
+        ..., description="queued, parsing, processing, completed or failed"
+    )
+    filenames: List[str] = Field(..., description="Names of the uploaded files")
+    links_parsed: int = Field(
+        ..., description="Unique YouTube videos found in the files"
+    )
+    processed: int = Field(..., description="Links handled so far")
+    links_duplicate: int = Field(..., description="Videos the user already had")
+    links_invalid: int = Field(..., description="Links that are not YouTube videos")
+    links_enriched: int = Field(..., description="Inserted links with metadata")
+    links_inserted: int = Field(..., description="Links stored for the user")
+    error: Optional[str] = Field(None, description="Why the job failed, if it did")
+    created_at: datetime = Field(..., description="When the job was created")
+    updated_at: datetime = Field(..., description="When the job last made progress")
+
+
+class ImportJobResponse(BaseModel):
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    job: ImportJob = Field(..., description="The import job")
+    message: str = Field(..., description="Response message")
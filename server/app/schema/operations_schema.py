@@ -0,0 +1,49 @@
+from pydantic import BaseModel, Field
+
+
+class QuotaUsageResponse(BaseModel):
+    """
+    Response schema for the YouTube Data API quota usage.
+    """
+
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    day: str = Field(..., description="Quota day (Pacific Time) the usage counts for")
+    daily_limit: int = Field(..., description="Units available per day")
+    spent: int = Field(..., description="Units spent so far today")
+    remaining: int = Field(..., description="Units left today")
+    low_priority_reserve: int = Field(
+        ..., description="Units kept free for interactive requests"
+    )
+    low_priority_deferred: bool = Field(
+        ..., description="True while background enrichment is being deferred"
+    )
+    rate_per_second: float = Field(..., description="Token bucket refill rate")
+    rate_burst: int = Field(..., description="Token bucket capacity")
+
+
+class DatabasePoolMetricsResponse(BaseModel):
+    """
+    Response schema for the database connection pool metrics of this worker.
+    """
+
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    pool_size: int = Field(..., description="Persistent connections in the pool")
+    max_overflow: int = Field(..., description="Extra connections allowed at peak")
+    checked_out: int = Field(..., description="Connections currently in use")
+    idle: int = Field(..., description="Connections waiting in the pool")
+    overflow: int = Field(..., description="Overflow connections currently open")
+    saturation: float = Field(
+        ..., description="checked_out / (pool_size + max_overflow)"
+    )
+    checkouts: int = Field(..., description="Checkouts since the worker started")
+    checkout_timeouts: int = Field(
+        ..., description="Checkouts that gave up after DB_POOL_TIMEOUT"
+    )
+    checkout_wait_avg_ms: float = Field(
+        ..., description="Average time spent waiting for a connection"
+    )
+    checkout_wait_max_ms: float = Field(
+        ..., description="Longest time spent waiting for a connection"
+    )
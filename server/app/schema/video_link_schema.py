@@ -2,6 +2,8 @@ from typing import List, Literal, Optional
 
 from pydantic import BaseModel, EmailStr, Field
 
+from app.config import conf
+
 
 class DefaultResponse(BaseModel):
     """
@@ -61,6 +63,9 @@ class VideoLinkWithMetadata(BaseModel):
     metadata: Optional[VideoMetadata] = Field(
         None, description="Metadata for the video link."
     )
+    enrichment_status: Optional[str] = Field(
+        None, description="Metadata enrichment state: pending, enriched or failed."
+    )
 
 
 class VideoLinkResponse(BaseModel):
@@ -93,6 +98,25 @@ class VideoLinkFileResponse(BaseModel):
     message: str = Field(..., description="Response message")
 
 
+class LinkEnrichmentStatus(BaseModel):
+    id: int = Field(..., description="The unique id of the video link.")
+    url: str = Field(..., description="The video link (URL).")
+    video_id: str = Field(..., description="The YouTube video id.")
+    enrichment_status: str = Field(
+        ..., description="Metadata enrichment state: pending, enriched or failed."
+    )
+
+
+class EnrichmentStatusResponse(BaseModel):
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    links: List[LinkEnrichmentStatus] = Field(
+        ..., description="Enrichment state of each requested link"
+    )
+    completed: bool = Field(..., description="True once no link is pending")
+    message: str = Field(..., description="Response message")
+
+
 class LinkResponse(BaseModel):
     version: str = Field(..., description="API version")
     status: int = Field(..., description="Response status code")
@@ -103,6 +127,39 @@ class LinkResponse(BaseModel):
         "file", description="Source of the video links"
     )
     uploader: EmailStr = Field(..., description="Uploader's email address")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page"
+    )
+    has_more: bool = Field(False, description="True if another page follows")
+    message: str = Field(..., description="Response message")
+
+
+class VideoDetail(VideoMetadata):
+    """
+    Full metadata of a single video, including the fields list endpoints omit
+    """
+
+    video_id: str = Field(..., description="The YouTube video id.")
+    url: str = Field(..., description="The video link (URL).")
+    source: Optional[str] = Field(None, description="Source of the video link")
+    tags: Optional[str] = Field(None, description="Tags of the YouTube video.")
+    duration_seconds: Optional[float] = Field(
+        None, description="Duration of the video in seconds."
+    )
+    view_count: Optional[int] = Field(None, description="View count of the video.")
+    like_count: Optional[int] = Field(None, description="Like count of the video.")
+    comment_count: Optional[int] = Field(
+        None, description="Comment count of the video."
+    )
+    enrichment_status: Optional[str] = Field(
+        None, description="Metadata enrichment state: pending, enriched or failed."
+    )
+
+
+class VideoDetailResponse(BaseModel):
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    video: VideoDetail = Field(..., description="The video with its full metadata")
     message: str = Field(..., description="Response message")
 
 
@@ -161,6 +218,48 @@ class PlaylistWithVideosResponse(BaseModel):
     message: str = Field(..., description="Response message")
 
 
+class PlaylistSummary(BaseModel):
+    playlist_id: int = Field(..., description="Unique ID of the playlist")
+    playlist_name: str = Field(..., description="Name of the playlist")
+    description: Optional[str] = Field(None, description="Description of the playlist")
+    visibility: str = Field(..., description="Playlist visibility")
+    creator_email: str = Field(..., description="Email of the creator")
+    video_count: Optional[int] = Field(
+        None,
+        description="Number of videos in the playlist; null on later pages of its videos",
+    )
+    thumbnails: List[str] = Field(
+        ..., description="Thumbnails of the latest videos in the playlist"
+    )
+
+
+class PlaylistSummaryResponse(BaseModel):
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    playlists: List[PlaylistSummary] = Field(
+        ..., description="One page of playlist summaries"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page"
+    )
+    has_more: bool = Field(False, description="True if another page follows")
+    message: str = Field(..., description="Response message")
+
+
+class PlaylistVideosPageResponse(BaseModel):
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    playlist: PlaylistSummary = Field(..., description="The playlist")
+    videos: List[VideoMetadata] = Field(
+        ..., description="One page of the playlist's videos"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `cursor` to fetch the next page"
+    )
+    has_more: bool = Field(False, description="True if another page follows")
+    message: str = Field(..., description="Response message")
+
+
 class ProgressTrackerRegister(BaseModel):
     last_time_watched: float = Field(..., description="Last watch time of the video")
 
@@ -178,6 +277,45 @@ class ProgressTrackerResponse(BaseModel):
     message: str = Field(..., description="Response Message")
 
 
+class ProgressBatchItem(BaseModel):
+    video_id: int = Field(..., description="Unique Id of the Video")
+    last_time_watched: float = Field(..., description="Last watch time of the video")
+
+
+class ProgressBatchRegister(BaseModel):
+    items: List[ProgressBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=conf.progress_batch_max_items,
+        description="Positions to record; the last entry wins for a repeated video",
+    )
+
+
+class ProgressBatchItemResult(BaseModel):
+    video_id: int = Field(..., description="Unique Id of the Video")
+    status: Literal["updated", "not_found"] = Field(
+        ..., description="Whether the position was recorded"
+    )
+    is_completed: bool = Field(False, description="Marker to know videos status")
+    last_time_watched: Optional[float] = Field(
+        None, description="Last WatchTime of the video"
+    )
+    duration: Optional[float] = Field(None, description="Total duration of the video")
+    completion_percentage: Optional[float] = Field(
+        None, description="Percentage by completion of the video"
+    )
+
+
+class ProgressBatchResponse(BaseModel):
+    version: str = Field(..., description="API version")
+    status: int = Field(..., description="Response status code")
+    results: List[ProgressBatchItemResult] = Field(
+        ..., description="Outcome of each video, in request order"
+    )
+    updated: int = Field(..., description="Number of videos whose position was saved")
+    message: str = Field(..., description="Response message")
+
+
 class PlaylistProgressTrackerResponse(BaseModel):
     version: str = Field(..., description="API version")
     status: int = Field(..., description="Status code of the http response")
@@ -1,3 +1,33 @@
-from .api_utils import download_video, fetch_youtube_video_metadata
-from .file_utils import extract_file_id, extract_file_link, extract_youtube_link_id
-from .redis_utils import cache_response, user_cache_key
+from .api_utils import (
+    download_video,
+    fetch_youtube_video_chunk,
+    fetch_youtube_video_statistics,
+)
+from .enrichment_utils import (
+    ENRICHMENT_QUEUE,
+    build_link_payloads,
+    enqueue_video_enrichment,
+    enrich_video_ids,
+    get_video_metadata,
+)
+from .file_utils import (
+    canonical_youtube_url,
+    canonicalize_links,
+    extract_file_id,
+    extract_file_link,
+    extract_youtube_link_id,
+    file_extension,
+    hash_upload,
+    spool_upload,
+    stream_file_links,
+)
+from .pagination_utils import decode_cursor, encode_cursor
+from .redis_utils import (
+    cache_response,
+    cache_response_page,
+    get_cached_upload_links,
+    get_cached_video_metadata,
+    set_cached_upload_links,
+    set_cached_video_metadata,
+    user_cache_key,
+)
@@ -1,12 +1,15 @@
 import asyncio
 import re
-from typing import Optional
+from typing import Dict, List, Optional
 
-import requests
+import httpx
 from yt_dlp import YoutubeDL
 
-from app.config import get_logger
+from app.config import conf, get_logger
 from app.config.conf import youtube_url
+from app.config.http_client import get_http_client
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.quota_utils import HIGH_PRIORITY, acquire_quota
 
 logger = get_logger(f"__name__")
 
@@ -32,71 +35,147 @@ def iso8601_duration_to_seconds(duration: Optional[str]) -> Optional[int]:
         return None
 
 
-def fetch_youtube_video_metadata(video_id: str, api_key: str) -> Optional[dict]:
+YOUTUBE_MAX_IDS_PER_REQUEST = 50
+
+# 403 covers Google's own quotaExceeded / rateLimitExceeded answers
+YOUTUBE_FAILURE_STATUSES = {403, 429}
+
+youtube_breaker = CircuitBreaker(
+    "youtube",
+    failure_threshold=conf.youtube_breaker_failure_threshold,
+    recovery_timeout=conf.youtube_breaker_recovery_seconds,
+)
+
+
+def _normalize_video_item(info: dict) -> dict:
+    """
+    Flatten a single `videos.list` item into the fields stored on UploadedLinks.
     """
-    Returns a dict with normalized fields or None if not found/error.
-    Keeps errors internal and returns None so callers can decide.
+    snippet = info.get("snippet", {})
+    content = info.get("contentDetails", {})
+    statistics = info.get("statistics", {})
+
+    return {
+        "video_id": info.get("id"),
+        "etag": info.get("etag"),
+        "title": snippet.get("title"),
+        "description": snippet.get("description"),
+        "channel_title": snippet.get("channelTitle"),
+        "published_at": snippet.get("publishedAt"),
+        "thumbnail_url": (snippet.get("thumbnails") or {}).get("high", {}).get("url"),
+        "duration_iso8601": content.get("duration"),
+        "duration_seconds": iso8601_duration_to_seconds(content.get("duration")),
+        "view_count": (
+            int(statistics.get("viewCount")) if statistics.get("viewCount") else None
+        ),
+        "like_count": (
+            int(statistics.get("likeCount")) if statistics.get("likeCount") else None
+        ),
+        "comment_count": (
+            int(statistics.get("commentCount"))
+            if statistics.get("commentCount")
+            else None
+        ),
+    }
+
+
+async def _youtube_get(params: dict, priority: str) -> httpx.Response:
     """
+    Issue one `videos.list` request behind the circuit breaker and quota limiter.
+
+    Raises CircuitOpenError without touching the network while the circuit is
+    open. Transport errors, 5xx, 403 and 429 answers count as upstream failures.
+    Any other non-2xx answer is raised as httpx.HTTPStatusError.
+    """
+    youtube_breaker.before_call()
     try:
-        if not video_id:
-            logger.error("No Video Id provide")
-            return None
+        await acquire_quota(1, priority)
+        resp = await get_http_client().get(youtube_url, params=params)
+    except httpx.TransportError:
+        youtube_breaker.record_failure()
+        raise
+    except BaseException:
+        youtube_breaker.release()
+        raise
 
-        url = youtube_url
-        params = {
-            "part": "snippet,contentDetails,statistics",
-            "id": video_id,
-            "key": api_key,
-        }
-        resp = requests.get(url, params=params, timeout=8)
-        if resp.status_code != 200:
-            logger.warning(
-                "YouTube API returned non-200 for %s: %s", video_id, resp.status_code
-            )
-            return None
+    if resp.status_code >= 500 or resp.status_code in YOUTUBE_FAILURE_STATUSES:
+        youtube_breaker.record_failure()
+    else:
+        youtube_breaker.record_success()
 
-        data = resp.json()
-        items = data.get("items") or []
-        if not items:
-            logger.info("YouTube API returned no items for %s", video_id)
-            return None
+    resp.raise_for_status()
+    return resp
 
-        info = items[0]
-        snippet = info.get("snippet", {})
-        content = info.get("contentDetails", {})
-        statistics = info.get("statistics", {})
-
-        return {
-            "video_id": video_id,
-            "etag": info.get("etag"),
-            "title": snippet.get("title"),
-            "description": snippet.get("description"),
-            "channel_title": snippet.get("channelTitle"),
-            "published_at": snippet.get("publishedAt"),
-            "thumbnail_url": (snippet.get("thumbnails") or {})
-            .get("high", {})
-            .get("url"),
-            "duration_iso8601": content.get("duration"),
-            "duration_seconds": iso8601_duration_to_seconds(content.get("duration")),
-            "view_count": (
-                int(statistics.get("viewCount"))
-                if statistics.get("viewCount")
-                else None
-            ),
-            "like_count": (
-                int(statistics.get("likeCount"))
-                if statistics.get("likeCount")
-                else None
-            ),
-            "comment_count": (
-                int(statistics.get("commentCount"))
-                if statistics.get("commentCount")
-                else None
-            ),
-        }
-    except Exception as exc:
-        logger.error("Error fetching YouTube metadata for %s: %s", video_id, str(exc))
-        return None
+
+async def fetch_youtube_video_chunk(
+    video_ids: List[str], api_key: str, priority: str = HIGH_PRIORITY
+) -> Dict[str, dict]:
+    """
+    Run a single `videos.list` call for at most YOUTUBE_MAX_IDS_PER_REQUEST ids.
+
+    Raises on transport errors, non-200 responses, exhausted quota and an open
+    circuit, so callers can tell a failed call apart from ids that do not exist. The call goes through the shared async HTTP
+    client, so it does not block the event loop and reuses pooled connections.
+    """
+    if len(video_ids) > YOUTUBE_MAX_IDS_PER_REQUEST:
+        raise ValueError(
+            f"At most {YOUTUBE_MAX_IDS_PER_REQUEST} ids are allowed per request"
+        )
+
+    params = {
+        "part": "snippet,contentDetails,statistics",
+        "id": ",".join(video_ids),
+        "key": api_key,
+        "maxResults": YOUTUBE_MAX_IDS_PER_REQUEST,
+    }
+    resp = await _youtube_get(params, priority)
+
+    results: Dict[str, dict] = {}
+    items = resp.json().get("items") or []
+    for info in items:
+        meta = _normalize_video_item(info)
+        if meta["video_id"]:
+            results[meta["video_id"]] = meta
+
+    missing = len(video_ids) - len(results)
+    if missing:
+        logger.info("YouTube API returned no items for %d ids", missing)
+
+    return results
+
+
+async def fetch_youtube_video_statistics(
+    video_ids: List[str], api_key: str, priority: str = HIGH_PRIORITY
+) -> Dict[str, dict]:
+    """
+    Fetch only the `statistics` part for at most YOUTUBE_MAX_IDS_PER_REQUEST ids.
+    Returns `{video_id: {"view_count", "like_count", "comment_count"}}` and
+    raises like `fetch_youtube_video_chunk`.
+    """
+    if len(video_ids) > YOUTUBE_MAX_IDS_PER_REQUEST:
+        raise ValueError(
+            f"At most {YOUTUBE_MAX_IDS_PER_REQUEST} ids are allowed per request"
+        )
+
+    params = {
+        "part": "statistics",
+        "id": ",".join(video_ids),
+        "key": api_key,
+        "maxResults": YOUTUBE_MAX_IDS_PER_REQUEST,
+        "fields": "items(id,statistics(viewCount,likeCount,commentCount))",
+    }
+    resp = await _youtube_get(params, priority)
+
+    results: Dict[str, dict] = {}
+    for info in resp.json().get("items") or []:
+        meta = _normalize_video_item(info)
+        if meta["video_id"]:
+            results[meta["video_id"]] = {
+                "view_count": meta["view_count"],
+                "like_count": meta["like_count"],
+                "comment_count": meta["comment_count"],
+            }
+    return results
 
 
 async def download_video(url: str, output_path="downloads") -> bool:
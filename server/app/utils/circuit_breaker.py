@@ -0,0 +1,80 @@
+import time
+
+from app.config import get_logger
+
+logger = get_logger(f"{__name__}")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    In-process circuit breaker for an upstream dependency.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    fail fast with CircuitOpenError. Once `recovery_timeout` seconds have passed
+    it half-opens and lets `half_open_max_calls` probe calls through: a success
+    closes it again, a failure re-opens it.
+
+    Callers run `before_call()` first and then report the outcome with
+    `record_success()`, `record_failure()` or, when the call never reached the
+    upstream, `release()`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probes = 0
+
+    def before_call(self):
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            self.state = HALF_OPEN
+            self._probes = 0
+            logger.info("%s circuit half-open, probing upstream", self.name)
+
+        if self.state == HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                raise CircuitOpenError(f"{self.name} circuit is half-open")
+            self._probes += 1
+
+    def record_success(self):
+        if self.state != CLOSED:
+            logger.info("%s circuit closed", self.name)
+        self.state = CLOSED
+        self.failures = 0
+        self._probes = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning(
+                    "%s circuit opened after %d failures", self.name, self.failures
+                )
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._probes = 0
+
+    def release(self):
+        """Give back a half-open probe slot when a call ended without a verdict."""
+        if self.state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
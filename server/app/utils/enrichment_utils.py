@@ -0,0 +1,208 @@
+import asyncio
+from typing import Dict, List, Tuple
+
+from app.config import conf, get_logger, push_queue
+from app.models.constants import EnrichmentStatus
+from app.utils.api_utils import YOUTUBE_MAX_IDS_PER_REQUEST, fetch_youtube_video_chunk
+from app.utils.file_utils import extract_youtube_link_id
+from app.utils.quota_utils import HIGH_PRIORITY
+from app.utils.redis_utils import (
+    get_cached_video_metadata,
+    get_missing_video_ids,
+    set_cached_video_metadata,
+    set_missing_video_ids,
+)
+
+logger = get_logger(f"{__name__}")
+
+ENRICHMENT_QUEUE = "metadata:enrichment_queue"
+
+METADATA_FIELDS = (
+    "video_id",
+    "etag",
+    "title",
+    "description",
+    "channel_title",
+    "thumbnail_url",
+    "duration_seconds",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "tags",
+)
+
+
+async def enrich_video_ids(
+    video_ids: List[str],
+    api_key: str | None = None,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+    priority: str = HIGH_PRIORITY,
+) -> Tuple[Dict[str, dict], List[str]]:
+    """
+    Fetch metadata for `video_ids` with bounded concurrency.
+
+    Ids are split into chunks of at most 50 and the chunks are fetched in
+    parallel, never more than `concurrency` at a time. Every call is capped by
+    `timeout`; a chunk that fails or times out is logged and its ids are left
+    out of the result, so the rest of the batch is unaffected.
+
+    Returns `(metadata, not_found)`, where `not_found` only holds ids that a
+    successful call reported as missing, never ids of failed chunks.
+    """
+    api_key = api_key or conf.youtube_key
+    concurrency = max(concurrency or conf.metadata_concurrency, 1)
+    timeout = timeout or conf.metadata_timeout
+    chunk_size = min(max(conf.metadata_chunk_size, 1), YOUTUBE_MAX_IDS_PER_REQUEST)
+
+    unique_ids = list(dict.fromkeys(vid for vid in video_ids or [] if vid))
+    chunks = [
+        unique_ids[start : start + chunk_size]
+        for start in range(0, len(unique_ids), chunk_size)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(chunk: List[str]) -> Dict[str, dict]:
+        async with semaphore:
+            return await asyncio.wait_for(
+                fetch_youtube_video_chunk(chunk, api_key, priority), timeout
+            )
+
+    outcomes = await asyncio.gather(
+        *(_fetch(chunk) for chunk in chunks), return_exceptions=True
+    )
+
+    metadata: Dict[str, dict] = {}
+    not_found: List[str] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(
+                "Metadata enrichment failed for %d ids (%s): %r",
+                len(chunk),
+                ",".join(chunk),
+                outcome,
+            )
+            continue
+        metadata.update(outcome)
+        not_found.extend(vid for vid in chunk if vid not in outcome)
+
+    return metadata, not_found
+
+
+async def _cache_metadata(entries: Dict[str, dict]):
+    try:
+        await set_cached_video_metadata(entries)
+    except Exception as exc:
+        logger.error("Video metadata cache update failed: %s", exc)
+
+
+async def _cache_missing(video_ids: List[str]):
+    try:
+        await set_missing_video_ids(video_ids)
+    except Exception as exc:
+        logger.error("Negative metadata cache update failed: %s", exc)
+
+
+async def get_video_metadata(
+    video_ids: List[str], api_key: str | None = None, priority: str = HIGH_PRIORITY
+) -> Tuple[Dict[str, dict], List[str]]:
+    """
+    Resolve metadata through the shared Redis cache before going to YouTube.
+
+    Fresh hits are served as is; stale hits and misses are refetched together
+    through `enrich_video_ids`, 50 ids per call, and cached for every other user
+    adding the same video. A stale entry whose refetch fails is still served.
+    Ids recently found missing are skipped without any call.
+
+    Returns `(metadata, not_found)` like `enrich_video_ids`: `not_found` only
+    holds ids YouTube reported as missing. Ids in neither were lost to a failed
+    call (timeout, 5xx, open circuit, quota) and are worth retrying.
+    """
+    api_key = api_key or conf.youtube_key
+    unique_ids = list(dict.fromkeys(vid for vid in video_ids or [] if vid))
+    if not unique_ids:
+        return {}, []
+
+    known_missing = set()
+    try:
+        known_missing = await get_missing_video_ids(unique_ids)
+        unique_ids = [vid for vid in unique_ids if vid not in known_missing]
+        cached = await get_cached_video_metadata(unique_ids)
+    except Exception as exc:
+        logger.error("Video metadata cache lookup failed: %s", exc)
+        cached = {}
+
+    metadata = {vid: entry["meta"] for vid, entry in cached.items() if entry["fresh"]}
+    to_fetch = [vid for vid in unique_ids if vid not in metadata]
+    not_found = list(known_missing)
+
+    if to_fetch:
+        fetched, missing = await enrich_video_ids(
+            to_fetch, api_key=api_key, priority=priority
+        )
+        metadata.update(fetched)
+        not_found.extend(missing)
+        await _cache_metadata(fetched)
+        await _cache_missing(missing)
+
+        failed = set(to_fetch) - set(fetched) - set(missing)
+        metadata.update({vid: cached[vid]["meta"] for vid in failed if vid in cached})
+
+    return metadata, not_found
+
+
+async def build_link_payloads(
+    urls: List[str], fetch_metadata: bool = True, priority: str = HIGH_PRIORITY
+) -> List[dict]:
+    """
+    Build the `create_video_link` payloads for new urls.
+    Metadata comes from `get_video_metadata`; urls without metadata are still
+    stored with their video id only. Videos YouTube reports missing are FAILED;
+    those lost to a failed call are left PENDING, and callers should hand them
+    to the background enrichment worker. With `fetch_metadata=False` no lookup
+    happens at all and every payload is left pending. Background callers pass
+    `priority=LOW_PRIORITY` so they back off before the quota reserve.
+    """
+    video_ids = {url: extract_youtube_link_id(url) for url in urls}
+    metadata, not_found = {}, set()
+    if fetch_metadata:
+        metadata, missing = await get_video_metadata(
+            [vid for vid in video_ids.values() if vid], priority=priority
+        )
+        not_found = set(missing)
+
+    link_payloads = []
+    for url, vid in video_ids.items():
+        item: dict = {"url": url}
+
+        if not vid:
+            logger.info("Could not extract video id from url: %s", url)
+            link_payloads.append(item)
+            continue
+
+        meta = metadata.get(vid)
+        if meta:
+            item.update({field: meta.get(field) for field in METADATA_FIELDS})
+            item["enrichment_status"] = EnrichmentStatus.ENRICHED
+        else:
+            item.update(
+                {
+                    "video_id": vid,
+                    "enrichment_status": (
+                        EnrichmentStatus.FAILED
+                        if vid in not_found
+                        else EnrichmentStatus.PENDING
+                    ),
+                }
+            )
+
+        link_payloads.append(item)
+
+    return link_payloads
+
+
+async def enqueue_video_enrichment(video_ids: List[str]):
+    """
+    Hand video ids over to the background enrichment worker.
+    """
+    await push_queue(ENRICHMENT_QUEUE, list(dict.fromkeys(video_ids)))
@@ -1,16 +1,119 @@
+import asyncio
+import codecs
 import csv
+import hashlib
 import io
+import os
 import re
-from typing import List
+import tempfile
+from typing import AsyncIterator, BinaryIO, Dict, Iterable, Iterator, List
+from urllib.parse import parse_qs, urlparse
 
 import PyPDF2
+from fastapi import UploadFile
 from openpyxl import load_workbook
 
+from app.config import conf, get_process_pool
+
+URL_PATTERN = re.compile(r"https?://[^\s]+")
+# trailing punctuation picked up from text or CSV cells is ignored
+YOUTUBE_ID_PATTERN = re.compile(r"^([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])")
+YOUTUBE_HOSTS = {
+    "youtube.com",
+    "m.youtube.com",
+    "music.youtube.com",
+    "youtube-nocookie.com",
+}
+YOUTUBE_ID_PATHS = {"shorts", "embed", "live", "v"}
+
 
 def _extract_links_from_text(text: str) -> List[str]:
     """Extracts all URLs from plain text."""
-    url_pattern = r"https?://[^\s]+"
-    return re.findall(url_pattern, text)
+    return URL_PATTERN.findall(text)
+
+
+# .xlsx and .pdf parsers take a path or an open binary file, so pool tasks
+# can be handed the path of a spooled upload instead of its bytes
+
+
+def _extract_xlsx_links(source: str | BinaryIO) -> List[str]:
+    workbook = load_workbook(source, read_only=True)
+    links = []
+    for sheet in workbook.worksheets:
+        for row in sheet.iter_rows(values_only=True):
+            for cell in row:
+                if cell:
+                    links.extend(_extract_links_from_text(str(cell)))
+    return links
+
+
+def _count_pdf_pages(source: str | BinaryIO) -> int:
+    return len(PyPDF2.PdfReader(source).pages)
+
+
+def _extract_pdf_links(source: str | BinaryIO, start: int, stop: int) -> List[str]:
+    """Extract URLs from pages [start, stop) of a PDF."""
+    pdf_reader = PyPDF2.PdfReader(source)
+    links = []
+    for page in pdf_reader.pages[start:stop]:
+        text = page.extract_text() or ""
+        links.extend(_extract_links_from_text(text))
+    return links
+
+
+async def _run_in_pool(func, *args):
+    """
+    Run `func` in the parsing process pool, giving up after PARSE_TIMEOUT
+    seconds. Work still queued when the caller times out or is cancelled is
+    dropped from the pool.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(get_process_pool(), func, *args)
+    try:
+        return await asyncio.wait_for(future, timeout=conf.parse_timeout)
+    except asyncio.TimeoutError:
+        raise ValueError("Timed out while parsing the file")
+
+
+async def extract_file_link_offloaded(path: str, filename: str) -> List[str]:
+    """
+    Same as `extract_file_link` for an .xlsx or .pdf file saved at `path`, but
+    parses in the process pool so the event loop stays free. PDF pages are
+    split into ranges of PDF_PAGES_PER_TASK and parsed in parallel. Tasks are
+    sent the path and open the file themselves, so the file's bytes are never
+    pickled to the workers.
+    """
+    filename = filename.lower()
+
+    if filename.endswith(".xlsx"):
+        return await _run_in_pool(_extract_xlsx_links, path)
+
+    if not filename.endswith(".pdf"):
+        raise ValueError("Only .xlsx and .pdf files are parsed in the process pool")
+
+    try:
+        page_count = await _run_in_pool(_count_pdf_pages, path)
+    except PyPDF2.errors.PdfReadError as e:
+        raise ValueError(f"Invalid PDF file: {e}")
+
+    if page_count > conf.pdf_max_pages:
+        raise ValueError(f"PDF has too many pages (max {conf.pdf_max_pages})")
+
+    step = conf.pdf_pages_per_task
+    tasks = [
+        asyncio.ensure_future(
+            _run_in_pool(_extract_pdf_links, path, start, min(start + step, page_count))
+        )
+        for start in range(0, page_count, step)
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    return [link for links in results for link in links]
 
 
 def extract_file_link(file_bytes: bytes, filename: str) -> List[str]:
@@ -34,27 +137,172 @@ def extract_file_link(file_bytes: bytes, filename: str) -> List[str]:
         return links
 
     elif filename.endswith(".xlsx"):
-        workbook = load_workbook(io.BytesIO(file_bytes), read_only=True)
-        links = []
-        for sheet in workbook.worksheets:
-            for row in sheet.iter_rows(values_only=True):
-                for cell in row:
-                    if cell:
-                        links.extend(_extract_links_from_text(str(cell)))
-        return links
+        return _extract_xlsx_links(io.BytesIO(file_bytes))
 
     elif filename.endswith(".pdf"):
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
-        links = []
-        for page in pdf_reader.pages:
-            text = page.extract_text() or ""
-            links.extend(_extract_links_from_text(text))
-        return links
+        pdf_file = io.BytesIO(file_bytes)
+        return _extract_pdf_links(pdf_file, 0, _count_pdf_pages(pdf_file))
 
     else:
         raise ValueError("Unsupported file type. Supported: .txt, .csv, .xlsx, .pdf")
 
 
+async def _read_chunks(
+    file: UploadFile, max_size: int, chunk_size: int | None = None
+) -> AsyncIterator[bytes]:
+    """
+    Read an uploaded file in chunks, raising ValueError once more than
+    `max_size` bytes have been read.
+    """
+    chunk_size = chunk_size or conf.upload_chunk_size
+    total = 0
+    while chunk := await file.read(chunk_size):
+        total += len(chunk)
+        if total > max_size:
+            raise ValueError(f"File {file.filename} too large")
+        yield chunk
+
+
+async def _iter_text(
+    file: UploadFile, max_size: int, chunk_size: int | None = None
+) -> AsyncIterator[str]:
+    """
+    Decode an uploaded file chunk by chunk. Multi-byte characters split across
+    chunk boundaries are held back by the incremental decoder.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    async for chunk in _read_chunks(file, max_size, chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def _stream_text_links(
+    file: UploadFile, max_size: int, chunk_size: int | None = None
+) -> AsyncIterator[str]:
+    """
+    Yield URLs from a plain text upload. Everything after the last whitespace of
+    a chunk is carried over, so a URL split across two chunks stays intact.
+    """
+    carry = ""
+    async for text in _iter_text(file, max_size, chunk_size):
+        buffer = carry + text
+        cut = max(buffer.rfind(" "), buffer.rfind("\n"), buffer.rfind("\t"))
+        if cut == -1:
+            carry = buffer
+            continue
+        carry = buffer[cut + 1 :]
+        for link in URL_PATTERN.findall(buffer, 0, cut + 1):
+            yield link
+    for link in URL_PATTERN.findall(carry):
+        yield link
+
+
+def _csv_row_links(lines: List[str]) -> Iterator[str]:
+    for row in csv.reader(lines):
+        for cell in row:
+            yield from URL_PATTERN.findall(cell)
+
+
+async def _stream_csv_links(
+    file: UploadFile, max_size: int, chunk_size: int | None = None
+) -> AsyncIterator[str]:
+    """
+    Yield URLs from a CSV upload. Complete lines are handed to the csv reader
+    once their quotes balance, so quoted cells spanning lines parse correctly.
+    """
+    carry = ""
+    pending: List[str] = []
+    quotes = 0
+    async for text in _iter_text(file, max_size, chunk_size):
+        lines = (carry + text).split("\n")
+        carry = lines.pop()
+        for line in lines:
+            pending.append(line + "\n")
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                for link in _csv_row_links(pending):
+                    yield link
+                pending = []
+                quotes = 0
+    if carry:
+        pending.append(carry)
+    for link in _csv_row_links(pending):
+        yield link
+
+
+def file_extension(filename: str | None) -> str:
+    """
+    Return the lowercased extension of a supported link file, e.g. "csv".
+    Raises ValueError for anything else.
+    """
+    extension = os.path.splitext((filename or "").lower())[1]
+    if extension not in (".txt", ".csv", ".xlsx", ".pdf"):
+        raise ValueError("Unsupported file type. Supported: .txt, .csv, .xlsx, .pdf")
+    return extension[1:]
+
+
+def _max_file_size(extension: str) -> int:
+    if extension in ("txt", "csv"):
+        return conf.upload_max_text_file_size
+    return conf.upload_max_file_size
+
+
+async def hash_upload(file: UploadFile) -> str:
+    """
+    Return the sha256 hex digest of an upload, reading it in chunks within the
+    size limit of its file type, then rewind it so it can be parsed.
+    """
+    digest = hashlib.sha256()
+    extension = file_extension(file.filename)
+    async for chunk in _read_chunks(file, _max_file_size(extension)):
+        digest.update(chunk)
+    await file.seek(0)
+    return digest.hexdigest()
+
+
+async def spool_upload(file: UploadFile, path: str):
+    """
+    Copy an upload to `path` in chunks, within the size limit of its file type.
+    """
+    max_size = _max_file_size(file_extension(file.filename))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as out:
+        async for chunk in _read_chunks(file, max_size):
+            await asyncio.to_thread(out.write, chunk)
+
+
+async def stream_file_links(file: UploadFile) -> AsyncIterator[str]:
+    """
+    Yield URLs from an uploaded file without holding the whole upload in memory.
+    .txt and .csv are parsed incrementally and may be up to
+    UPLOAD_MAX_TEXT_FILE_SIZE; .xlsx and .pdf need random access, so they are
+    spooled to a temporary file up to UPLOAD_MAX_FILE_SIZE and parsed from it
+    in the process pool.
+    """
+    extension = file_extension(file.filename)
+    max_size = _max_file_size(extension)
+
+    if extension == "txt":
+        async for link in _stream_text_links(file, max_size):
+            yield link
+
+    elif extension == "csv":
+        async for link in _stream_csv_links(file, max_size):
+            yield link
+
+    else:
+        with tempfile.NamedTemporaryFile(suffix=f".{extension}") as spooled:
+            async for chunk in _read_chunks(file, max_size):
+                await asyncio.to_thread(spooled.write, chunk)
+            await asyncio.to_thread(spooled.flush)
+            for link in await extract_file_link_offloaded(spooled.name, file.filename):
+                yield link
+
+
 def extract_file_id(file_url: str) -> str:
     """
     Extract the specific file-id from the long url
@@ -69,28 +317,55 @@ def extract_file_id(file_url: str) -> str:
 def extract_youtube_link_id(url: str) -> str | None:
     """
     Extract the YouTube Video ID from a given URL.
+    Understands youtu.be, watch (with `v` anywhere in the query), shorts, embed,
+    live and /v/ links on www, m, music and youtube-nocookie hosts.
     Returns the video ID string if valid, else None.
     """
     if not url:
         return None
 
-    pattern = (
-        r"(?:https?://)?"
-        r"(?:www\.)?"
-        r"(?:youtube\.com/watch\?v=|"
-        r"youtu\.be/|"
-        r"youtube\.com/embed/|"
-        r"youtube\.com/shorts/)"
-        r"([^\s&?/]{11})"
-    )
-
-    match = re.search(pattern, url)
-    if not match:
+    url = url.strip()
+    if "://" not in url:
+        url = f"https://{url}"
+
+    try:
+        parsed = urlparse(url)
+    except ValueError:
         return None
 
-    video_id = match.group(1)
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    segments = [segment for segment in parsed.path.split("/") if segment]
 
-    if re.match(r"^[A-Za-z0-9_-]{11}$", video_id):
-        return video_id
+    video_id = None
+    if host == "youtu.be":
+        video_id = segments[0] if segments else None
+    elif host in YOUTUBE_HOSTS:
+        if segments[:1] == ["watch"]:
+            video_id = next(iter(parse_qs(parsed.query).get("v", [])), None)
+        elif len(segments) >= 2 and segments[0] in YOUTUBE_ID_PATHS:
+            video_id = segments[1]
+
+    match = YOUTUBE_ID_PATTERN.match(video_id or "")
+    if match:
+        return match.group(1)
 
     return None
+
+
+def canonical_youtube_url(video_id: str) -> str:
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def canonicalize_links(urls: Iterable[str]) -> Dict[str, str]:
+    """
+    Map links to `{video_id: canonical url}`, keeping the first occurrence of
+    each video and dropping links that are not YouTube videos.
+    """
+    canonical = {}
+    for url in urls:
+        video_id = extract_youtube_link_id(url)
+        if video_id and video_id not in canonical:
+            canonical[video_id] = canonical_youtube_url(video_id)
+    return canonical
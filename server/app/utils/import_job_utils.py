@@ -0,0 +1,280 @@
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import List
+
+from app.config import conf, get_redis
+from app.models import ImportJobStatus
+
+IMPORT_JOBS_ACTIVE = "import_jobs:active"
+
+# token of the spool directory every app instance must share
+IMPORT_SPOOL_MARKER_KEY = "import_spool:marker"
+IMPORT_SPOOL_MARKER_FILE = ".focustube-spool"
+
+IMPORT_JOB_COUNTERS = (
+    "links_parsed",
+    "links_invalid",
+    "processed",
+    "attempts",
+)
+
+# recorded per chunk and summed on read, so re-running a chunk can't double count
+IMPORT_CHUNK_COUNTERS = (
+    "links_duplicate",
+    "links_enriched",
+    "links_inserted",
+)
+
+# delete / extend the lock only while it still holds this worker's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+REFRESH_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("EXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+FINISHED_STATUSES = {ImportJobStatus.COMPLETED.value, ImportJobStatus.FAILED.value}
+
+
+def import_job_key(job_id: str) -> str:
+    return f"import_job:{job_id}"
+
+
+def import_job_links_key(job_id: str) -> str:
+    return f"import_job:{job_id}:links"
+
+
+def import_job_chunks_key(job_id: str) -> str:
+    return f"import_job:{job_id}:chunks"
+
+
+def import_job_lock_key(job_id: str) -> str:
+    return f"import_job:{job_id}:lock"
+
+
+def import_job_spool_dir(job_id: str) -> str:
+    """Directory holding the uploaded files of a job until it finishes."""
+    return os.path.join(conf.import_spool_dir, job_id)
+
+
+def _read_spool_marker(path: str) -> str | None:
+    try:
+        with open(path) as fh:
+            return fh.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+async def check_import_spool_dir():
+    """
+    Fail at startup unless IMPORT_SPOOL_DIR is set, writable and shared by every
+    app instance. Jobs are queued in Redis and any worker may claim them, so a
+    file spooled on one host has to be readable on all the others.
+
+    The first instance creates a marker file holding a random token and records
+    the token in Redis; every other instance must find the same token on disk.
+    """
+    spool_dir = conf.import_spool_dir
+    if not spool_dir:
+        raise RuntimeError(
+            "IMPORT_SPOOL_DIR must point to storage shared by every app instance"
+        )
+    os.makedirs(spool_dir, exist_ok=True)
+    if not os.access(spool_dir, os.W_OK):
+        raise RuntimeError(f"IMPORT_SPOOL_DIR {spool_dir} is not writable")
+
+    redis = get_redis()
+    marker = os.path.join(spool_dir, IMPORT_SPOOL_MARKER_FILE)
+    token = await redis.get(IMPORT_SPOOL_MARKER_KEY)
+    if token is None:
+        try:
+            with open(marker, "x") as fh:
+                fh.write(uuid.uuid4().hex)
+        except FileExistsError:
+            pass
+        await redis.set(IMPORT_SPOOL_MARKER_KEY, _read_spool_marker(marker), nx=True)
+        token = await redis.get(IMPORT_SPOOL_MARKER_KEY)
+
+    if _read_spool_marker(marker) != token:
+        raise RuntimeError(
+            f"IMPORT_SPOOL_DIR {spool_dir} is not the storage the other app "
+            f"instances use. Mount the shared volume there, or delete the Redis "
+            f"key {IMPORT_SPOOL_MARKER_KEY} after moving the spool to new storage."
+        )
+
+
+def new_import_job_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+async def create_import_job(job_id: str, user_id: int, files: List[dict]) -> dict:
+    """
+    Register a queued import job for `files` (`[{"path", "filename"}]`, already
+    spooled to disk) and mark it active so an import worker picks it up.
+    """
+    redis = get_redis()
+    now = _now()
+    job = {
+        "job_id": job_id,
+        "user_id": user_id,
+        "files": json.dumps(files),
+        "status": ImportJobStatus.QUEUED.value,
+        "error": "",
+        "created_at": now,
+        "updated_at": now,
+        **{counter: 0 for counter in IMPORT_JOB_COUNTERS},
+    }
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(import_job_key(job_id), mapping=job)
+        pipe.expire(import_job_key(job_id), conf.import_job_ttl)
+        pipe.sadd(IMPORT_JOBS_ACTIVE, job_id)
+        await pipe.execute()
+    return await get_import_job(job_id)
+
+
+async def get_import_job(job_id: str) -> dict | None:
+    raw = await get_redis().hgetall(import_job_key(job_id))
+    if not raw:
+        return None
+    job = dict(raw)
+    job["user_id"] = int(job["user_id"])
+    job["files"] = json.loads(job["files"])
+    job["error"] = job.get("error") or None
+    for counter in IMPORT_JOB_COUNTERS:
+        job[counter] = int(job.get(counter, 0))
+
+    chunks = await get_redis().hvals(import_job_chunks_key(job_id))
+    for counter in IMPORT_CHUNK_COUNTERS:
+        job[counter] = 0
+    for raw in chunks:
+        for counter, amount in json.loads(raw).items():
+            job[counter] += amount
+    return job
+
+
+async def update_import_job(job_id: str, **fields):
+    await get_redis().hset(
+        import_job_key(job_id), mapping={**fields, "updated_at": _now()}
+    )
+
+
+async def get_active_import_job_ids() -> List[str]:
+    return list(await get_redis().smembers(IMPORT_JOBS_ACTIVE))
+
+
+async def claim_import_job(job_id: str) -> str | None:
+    """
+    Take the per-job lock so only one worker processes a job. Returns the token
+    identifying this claim, or None if another worker holds it. The lock expires
+    after IMPORT_LOCK_TTL seconds, so jobs of a crashed worker are picked up again.
+    """
+    token = uuid.uuid4().hex
+    claimed = await get_redis().set(
+        import_job_lock_key(job_id), token, nx=True, ex=conf.import_lock_ttl
+    )
+    return token if claimed else None
+
+
+async def refresh_import_job_claim(job_id: str, token: str) -> bool:
+    """Extend the lock; False if it expired or another worker holds it now."""
+    return bool(
+        await get_redis().eval(
+            REFRESH_LOCK_SCRIPT,
+            1,
+            import_job_lock_key(job_id),
+            token,
+            conf.import_lock_ttl,
+        )
+    )
+
+
+async def release_import_job(job_id: str, token: str):
+    await get_redis().eval(RELEASE_LOCK_SCRIPT, 1, import_job_lock_key(job_id), token)
+
+
+async def store_import_job_links(job_id: str, links: List[str], links_invalid: int = 0):
+    """
+    Save the parsed, de-duplicated links of a job and move it to processing.
+    Written in one transaction, so a crash while parsing simply re-parses.
+    """
+    key = import_job_links_key(job_id)
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.delete(key, import_job_chunks_key(job_id))
+        for start in range(0, len(links), 1000):
+            pipe.rpush(key, *links[start : start + 1000])
+        pipe.expire(key, conf.import_job_ttl)
+        pipe.hset(
+            import_job_key(job_id),
+            mapping={
+                "status": ImportJobStatus.PROCESSING.value,
+                "links_parsed": len(links),
+                "links_invalid": links_invalid,
+                "processed": 0,
+                "updated_at": _now(),
+            },
+        )
+        await pipe.execute()
+
+
+async def get_import_job_links(job_id: str, start: int, count: int) -> List[str]:
+    return await get_redis().lrange(
+        import_job_links_key(job_id), start, start + count - 1
+    )
+
+
+async def checkpoint_import_job(
+    job_id: str, start: int, processed: int, **counters: int
+):
+    """
+    Record that the first `processed` links are done, storing the `counters`
+    of the chunk starting at `start` in the same transaction. Re-running a
+    chunk overwrites its counters instead of adding to them.
+    """
+    chunks_key = import_job_chunks_key(job_id)
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.hset(chunks_key, str(start), json.dumps(counters))
+        pipe.expire(chunks_key, conf.import_job_ttl)
+        pipe.hset(
+            import_job_key(job_id),
+            mapping={"processed": processed, "updated_at": _now()},
+        )
+        await pipe.execute()
+
+
+async def finish_import_job(
+    job_id: str, status: ImportJobStatus, error: str | None = None
+):
+    """
+    Mark a job completed or failed, drop its link list and stop tracking it.
+    The job itself stays readable until IMPORT_JOB_TTL expires.
+    """
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.hset(
+            import_job_key(job_id),
+            mapping={
+                "status": status.value,
+                "error": error or "",
+                "updated_at": _now(),
+            },
+        )
+        pipe.delete(import_job_links_key(job_id))
+        pipe.srem(IMPORT_JOBS_ACTIVE, job_id)
+        await pipe.execute()
+
+
+async def count_import_job_attempt(job_id: str) -> int:
+    """Count a processing attempt and return the total so far."""
+    return await get_redis().hincrby(import_job_key(job_id), "attempts", 1)
@@ -0,0 +1,25 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(timestamp: datetime, id: int) -> str:
+    """
+    Encode the (timestamp, id) sort key of the last row of a page into an
+    opaque cursor.
+    """
+    payload = json.dumps({"t": timestamp.isoformat(), "i": id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor made by `encode_cursor`. Raises ValueError if it is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["t"]), int(payload["i"])
+    except (TypeError, KeyError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
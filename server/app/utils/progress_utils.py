@@ -0,0 +1,140 @@
+import json
+from datetime import datetime
+from typing import List, Optional
+
+from app.config import conf, get_redis
+
+# "{user_id}:{link_id}" members whose buffered position is newer than the DB
+PROGRESS_DIRTY = "progress:dirty"
+
+
+def progress_key(user_id: int) -> str:
+    return f"progress:{user_id}"
+
+
+def build_progress(
+    last_watched_time: float,
+    duration_seconds: Optional[float],
+    last_watched_at: Optional[datetime] = None,
+    is_completed: Optional[bool] = None,
+) -> dict:
+    """
+    The buffered progress of one link. Completion is derived from the position
+    unless given, e.g. when the row comes straight from the database.
+    """
+    if is_completed is None:
+        is_completed = (
+            duration_seconds is not None and last_watched_time >= duration_seconds
+        )
+    last_watched_at = last_watched_at or datetime.utcnow().replace(tzinfo=None)
+    return {
+        "last_watched_time": last_watched_time,
+        "duration_seconds": duration_seconds,
+        "is_completed": bool(is_completed),
+        "last_watched_at": last_watched_at.isoformat(),
+    }
+
+
+def _load(raw: Optional[str]) -> Optional[dict]:
+    if raw is None:
+        return None
+    progress = json.loads(raw)
+    progress["last_watched_at"] = datetime.fromisoformat(progress["last_watched_at"])
+    return progress
+
+
+def progress_entry(user_id: int, link_id: int, progress: dict) -> dict:
+    """The row `VideoLinkRepository.update_progress` expects for a position."""
+    last_watched_at = progress["last_watched_at"]
+    if isinstance(last_watched_at, str):
+        last_watched_at = datetime.fromisoformat(last_watched_at)
+    return {
+        "id": link_id,
+        "user_id": user_id,
+        "last_watched_time": progress["last_watched_time"],
+        "is_completed": progress["is_completed"],
+        "last_watched_at": last_watched_at,
+    }
+
+
+async def get_progress(user_id: int, link_id: int) -> Optional[dict]:
+    """The buffered progress of a link, or None if it isn't in Redis."""
+    return _load(await get_redis().hget(progress_key(user_id), str(link_id)))
+
+
+async def cache_progress(user_id: int, link_id: int, progress: dict):
+    """
+    Buffer progress read from the database; nothing is left to flush. A position
+    recorded in the meantime is newer and wins.
+    """
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hsetnx(progress_key(user_id), str(link_id), json.dumps(progress))
+        pipe.expire(progress_key(user_id), conf.progress_cache_ttl)
+        await pipe.execute()
+
+
+async def record_progress(user_id: int, link_id: int, progress: dict):
+    """Buffer a new position and mark it for the next flush."""
+    await record_many_progress(user_id, {link_id: progress})
+
+
+async def record_many_progress(
+    user_id: int, progress: dict[int, dict], dirty: bool = True
+):
+    """
+    Buffer positions of several links at once. Pass `dirty=False` for positions
+    already written to the database.
+    """
+    if not progress:
+        return
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            progress_key(user_id),
+            mapping={str(lid): json.dumps(p) for lid, p in progress.items()},
+        )
+        pipe.expire(progress_key(user_id), conf.progress_cache_ttl)
+        if dirty:
+            pipe.sadd(PROGRESS_DIRTY, *(f"{user_id}:{lid}" for lid in progress))
+        await pipe.execute()
+
+
+async def forget_progress(user_id: int, link_id: int):
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hdel(progress_key(user_id), str(link_id))
+        pipe.srem(PROGRESS_DIRTY, f"{user_id}:{link_id}")
+        await pipe.execute()
+
+
+async def pop_dirty_progress(count: int) -> List[dict]:
+    """
+    Take up to `count` dirty entries with their latest buffered position as
+    `{"id", "user_id", "last_watched_time", "is_completed", "last_watched_at"}`.
+    A position written after this call marks the link dirty again.
+    """
+    redis = get_redis()
+    members = await redis.spop(PROGRESS_DIRTY, count) or []
+    if not members:
+        return []
+
+    keys = [tuple(int(part) for part in member.split(":")) for member in members]
+    async with redis.pipeline(transaction=False) as pipe:
+        for user_id, link_id in keys:
+            pipe.hget(progress_key(user_id), str(link_id))
+        raws = await pipe.execute()
+
+    return [
+        progress_entry(user_id, link_id, _load(raw))
+        for (user_id, link_id), raw in zip(keys, raws)
+        if raw is not None
+    ]
+
+
+async def requeue_dirty_progress(entries: List[dict]):
+    """Mark entries dirty again after a failed flush."""
+    if entries:
+        await get_redis().sadd(
+            PROGRESS_DIRTY, *(f"{e['user_id']}:{e['id']}" for e in entries)
+        )
@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from app.config import conf, get_logger, get_redis
+
+logger = get_logger(f"{__name__}")
+
+# The YouTube Data API quota resets at midnight Pacific Time
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+QUOTA_BUCKET_KEY = "youtube_quota:bucket"
+
+HIGH_PRIORITY = "high"
+LOW_PRIORITY = "low"
+
+# Refills the bucket from the Redis clock so every worker shares the same view
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class QuotaExceeded(Exception):
+    """Raised when a YouTube API call would exceed the daily quota."""
+
+
+class QuotaDeferred(QuotaExceeded):
+    """Raised when low-priority work should wait for the next quota day."""
+
+
+def _quota_day() -> str:
+    return datetime.now(QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+
+def _daily_key(day: str) -> str:
+    return f"youtube_quota:{day}"
+
+
+def _reserve_for(priority: str) -> int:
+    return conf.youtube_quota_low_priority_reserve if priority == LOW_PRIORITY else 0
+
+
+async def quota_available(units: int = 1, priority: str = HIGH_PRIORITY) -> bool:
+    """
+    Return whether `units` could be spent today at the given priority.
+    Low-priority work keeps YOUTUBE_QUOTA_LOW_PRIORITY_RESERVE units free for
+    interactive requests.
+    """
+    spent = int(await get_redis().get(_daily_key(_quota_day())) or 0)
+    return spent + units <= conf.youtube_daily_quota - _reserve_for(priority)
+
+
+async def acquire_quota(units: int = 1, priority: str = HIGH_PRIORITY):
+    """
+    Reserve `units` of YouTube quota before making an API call.
+
+    Waits on the shared token bucket (YOUTUBE_RATE_PER_SECOND, bursting to
+    YOUTUBE_RATE_BURST) for at most YOUTUBE_RATE_MAX_WAIT seconds, then charges
+    the units to today's counter. Raises QuotaDeferred for low-priority work once
+    only the reserve is left, and QuotaExceeded when the daily budget is spent.
+    """
+    redis = get_redis()
+
+    waited = 0.0
+    while True:
+        wait = float(
+            await redis.eval(
+                _TOKEN_BUCKET_SCRIPT,
+                1,
+                QUOTA_BUCKET_KEY,
+                conf.youtube_rate_per_second,
+                conf.youtube_rate_burst,
+                units,
+            )
+        )
+        if wait <= 0:
+            break
+        if waited + wait > conf.youtube_rate_max_wait:
+            raise QuotaExceeded("YouTube API rate limit wait exceeded")
+        await asyncio.sleep(wait)
+        waited += wait
+
+    key = _daily_key(_quota_day())
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.incrby(key, units)
+        pipe.expire(key, 2 * 24 * 3600)
+        spent, _ = await pipe.execute()
+
+    limit = conf.youtube_daily_quota - _reserve_for(priority)
+    if spent > limit:
+        await redis.decrby(key, units)
+        if priority == LOW_PRIORITY and spent <= conf.youtube_daily_quota:
+            raise QuotaDeferred("YouTube quota reserved for interactive requests")
+        logger.warning("YouTube daily quota exhausted (%d units spent)", spent - units)
+        raise QuotaExceeded("YouTube daily quota exhausted")
+
+
+async def get_quota_usage() -> dict:
+    """
+    Current quota spend and remaining budget, for operators.
+    """
+    day = _quota_day()
+    redis = get_redis()
+    spent = int(await redis.get(_daily_key(day)) or 0)
+
+    return {
+        "day": day,
+        "daily_limit": conf.youtube_daily_quota,
+        "spent": spent,
+        "remaining": max(conf.youtube_daily_quota - spent, 0),
+        "low_priority_reserve": conf.youtube_quota_low_priority_reserve,
+        "low_priority_deferred": spent
+        >= conf.youtube_daily_quota - conf.youtube_quota_low_priority_reserve,
+        "rate_per_second": conf.youtube_rate_per_second,
+        "rate_burst": conf.youtube_rate_burst,
+    }
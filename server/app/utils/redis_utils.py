@@ -1,11 +1,23 @@
 import json
+import time
 from functools import wraps
+from typing import Dict, List
 
 from fastapi.encoders import jsonable_encoder
+from redis.exceptions import WatchError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.authentication.models import User
-from app.config import get_cache, set_cache
+from app.config import (
+    conf,
+    get_cache,
+    get_hash_cache,
+    get_many_cache,
+    get_redis,
+    set_cache,
+    set_hash_cache,
+    set_many_cache,
+)
 
 
 def cache_response(key_func, ttl=300):
@@ -26,5 +38,149 @@ def cache_response(key_func, ttl=300):
     return decorator
 
 
+def cache_response_page(key_func, field_func, ttl=300):
+    """
+    Like `cache_response`, but caches each page as a field of one hash under
+    `key_func(...)`, so deleting that key still invalidates every page.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = key_func(*args, **kwargs)
+            field = field_func(*args, **kwargs)
+            cached = await get_hash_cache(key, field)
+            if cached:
+                return json.loads(cached)
+            result = await func(*args, **kwargs)
+            encode_result = jsonable_encoder(result)
+            await set_hash_cache(key, field, json.dumps(encode_result), ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 def user_cache_key(current_user: User, db: AsyncSession):
     return f"user_profile:{current_user.id}"
+
+
+def video_metadata_key(video_id: str) -> str:
+    return f"video_meta:{video_id}"
+
+
+async def get_cached_video_metadata(video_ids: List[str]) -> Dict[str, dict]:
+    """
+    Look up the shared (cross-user) metadata cache.
+    Returns `{video_id: {"meta": ..., "fresh": bool}}` for every hit; entries
+    older than VIDEO_METADATA_FRESH_SECONDS come back with fresh=False and
+    should be refetched before use.
+    """
+    video_ids = list(dict.fromkeys(video_ids))
+    raw_entries = await get_many_cache([video_metadata_key(v) for v in video_ids])
+
+    now = time.time()
+    cached = {}
+    for video_id, raw in zip(video_ids, raw_entries):
+        if not raw:
+            continue
+        entry = json.loads(raw)
+        entry["fresh"] = now - entry.get("cached_at", 0) < (
+            conf.video_metadata_fresh_seconds
+        )
+        cached[video_id] = entry
+    return cached
+
+
+async def set_cached_video_metadata(entries: Dict[str, dict]):
+    """
+    Store `{video_id: meta}` in the shared metadata cache.
+    """
+    now = time.time()
+    await set_many_cache(
+        {
+            video_metadata_key(video_id): json.dumps({"meta": meta, "cached_at": now})
+            for video_id, meta in entries.items()
+        },
+        ttl=conf.video_metadata_cache_ttl,
+    )
+
+
+async def update_cached_video_stats(stats: Dict[str, dict]):
+    """
+    Write refreshed `{video_id: {"view_count", "like_count", "comment_count"}}`
+    into the cached metadata entries that exist, keeping their TTL and
+    `cached_at`. Uncached ids are skipped. If an entry is rewritten meanwhile
+    (WATCH fails), that newer entry is kept as is.
+    """
+    if not stats:
+        return
+    keys = {video_metadata_key(video_id): video_id for video_id in stats}
+    async with get_redis().pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(*keys)
+            raw_entries = await pipe.mget(list(keys))
+            pipe.multi()
+            for key, raw in zip(keys, raw_entries):
+                if not raw:
+                    continue
+                entry = json.loads(raw)
+                entry["meta"].update(stats[keys[key]])
+                pipe.set(key, json.dumps(entry), keepttl=True)
+            await pipe.execute()
+        except WatchError:
+            pass
+
+
+def missing_video_key(video_id: str) -> str:
+    return f"video_missing:{video_id}"
+
+
+async def get_missing_video_ids(video_ids: List[str]) -> set:
+    """
+    Return the ids recently confirmed as private, deleted or nonexistent.
+    """
+    video_ids = list(dict.fromkeys(video_ids))
+    flags = await get_many_cache([missing_video_key(v) for v in video_ids])
+    return {video_id for video_id, flag in zip(video_ids, flags) if flag}
+
+
+async def set_missing_video_ids(video_ids: List[str]):
+    """
+    Remember not-found ids for VIDEO_NEGATIVE_CACHE_TTL seconds so they are not
+    re-queried on every attempt.
+    """
+    await set_many_cache(
+        {missing_video_key(video_id): "1" for video_id in video_ids},
+        ttl=conf.video_negative_cache_ttl,
+    )
+
+
+def upload_links_key(extension: str, digest: str) -> str:
+    return f"upload_links:{extension}:{digest}"
+
+
+async def get_cached_upload_links(extension: str, digest: str) -> List[str] | None:
+    """
+    Return the URLs previously extracted from an upload with the same content
+    hash and file type, or None when the file has not been seen recently.
+    """
+    cached = await get_cache(upload_links_key(extension, digest))
+    if cached is None:
+        return None
+    return json.loads(cached)
+
+
+async def set_cached_upload_links(extension: str, digest: str, links: List[str]):
+    """
+    Remember the URLs extracted from an upload for UPLOAD_LINKS_CACHE_TTL seconds.
+    Very large link lists are not cached.
+    """
+    if len(links) > conf.upload_links_cache_max_links:
+        return
+    await set_cache(
+        upload_links_key(extension, digest),
+        json.dumps(links),
+        ttl=conf.upload_links_cache_ttl,
+    )
@@ -0,0 +1,24 @@
+import asyncio
+
+from .enrichment_worker import enrich_pending_videos, run_enrichment_worker
+from .import_worker import process_import_job, run_import_worker
+from .progress_flush_worker import flush_progress, run_progress_flush_worker
+from .stats_refresh_worker import refresh_video_stats, run_stats_refresh_worker
+
+_tasks: list[asyncio.Task] = []
+
+
+async def start_workers():
+    """Start the background workers at app startup"""
+    _tasks.append(asyncio.create_task(run_enrichment_worker()))
+    _tasks.append(asyncio.create_task(run_stats_refresh_worker()))
+    _tasks.append(asyncio.create_task(run_import_worker()))
+    _tasks.append(asyncio.create_task(run_progress_flush_worker()))
+
+
+async def stop_workers():
+    """Cancel the background workers at app shutdown"""
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
@@ -0,0 +1,100 @@
+import asyncio
+import traceback
+from typing import List
+
+from app.config import (
+    async_session_local,
+    conf,
+    delete_cache,
+    get_logger,
+    pop_queue_batch,
+    push_queue,
+)
+from app.models import EnrichmentStatus
+from app.repository import VideoLinkRepository
+from app.utils import ENRICHMENT_QUEUE, get_video_metadata
+from app.utils.quota_utils import LOW_PRIORITY, quota_available
+
+logger = get_logger(f"{__name__}")
+
+
+async def enrich_pending_videos(video_ids: List[str]):
+    """
+    Fetch metadata for queued video ids, store it in the catalog and drop the
+    cached listings of every user holding one of the videos.
+
+    Only ids YouTube reports as missing are marked FAILED. Ids lost to a failed
+    call (timeout, 5xx, open circuit, low quota) stay PENDING and are queued
+    again after YOUTUBE_QUOTA_DEFER_SECONDS.
+    """
+    async with async_session_local() as db:
+        repo = VideoLinkRepository(db)
+        pending = await repo.get_unenriched_video_ids(video_ids)
+        if not pending:
+            return
+
+        metadata, not_found = await get_video_metadata(pending, priority=LOW_PRIORITY)
+        not_found = set(not_found)
+        deferred = [
+            vid for vid in pending if vid not in metadata and vid not in not_found
+        ]
+
+        await repo.upsert_videos(
+            [
+                {**meta, "enrichment_status": EnrichmentStatus.ENRICHED}
+                for meta in metadata.values()
+            ]
+            + [
+                {"video_id": vid, "enrichment_status": EnrichmentStatus.FAILED}
+                for vid in pending
+                if vid in not_found
+            ]
+        )
+        await db.commit()
+
+        user_ids = await repo.get_video_owner_ids(pending)
+
+    for user_id in user_ids:
+        await delete_cache(f"user_videos:{user_id}")
+        await delete_cache(f"user_playlist:{user_id}")
+
+    logger.info(
+        "Enriched %d of %d pending videos for %d users (%d deferred)",
+        len(metadata),
+        len(pending),
+        len(user_ids),
+        len(deferred),
+    )
+    if deferred:
+        await push_queue(ENRICHMENT_QUEUE, deferred)
+        await asyncio.sleep(conf.youtube_quota_defer_seconds)
+
+
+async def run_enrichment_worker():
+    """
+    Consume the Redis enrichment queue until cancelled.
+    """
+    logger.info("Metadata enrichment worker started")
+    while True:
+        try:
+            video_ids = await pop_queue_batch(
+                ENRICHMENT_QUEUE,
+                conf.enrichment_batch_size,
+                timeout=conf.enrichment_poll_timeout,
+            )
+            if not video_ids:
+                continue
+
+            if not await quota_available(priority=LOW_PRIORITY):
+                logger.warning("YouTube quota low, deferring %d videos", len(video_ids))
+                await push_queue(ENRICHMENT_QUEUE, video_ids)
+                await asyncio.sleep(conf.youtube_quota_defer_seconds)
+                continue
+
+            await enrich_pending_videos(video_ids)
+        except asyncio.CancelledError:
+            logger.info("Metadata enrichment worker stopped")
+            raise
+        except Exception as e:
+            logger.error(f"Enrichment worker error: {e}\n{traceback.format_exc()}")
+            await asyncio.sleep(conf.enrichment_poll_timeout)
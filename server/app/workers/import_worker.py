@@ -0,0 +1,206 @@
+import asyncio
+import shutil
+import traceback
+from typing import List, Tuple
+
+from fastapi import UploadFile
+
+from app.config import (
+    async_session_local,
+    conf,
+    delete_cache,
+    get_logger,
+    mark_recent_write,
+)
+from app.models import EnrichmentStatus, ImportJobStatus
+from app.repository import VideoLinkRepository
+from app.utils import (
+    build_link_payloads,
+    canonicalize_links,
+    enqueue_video_enrichment,
+    extract_youtube_link_id,
+    stream_file_links,
+)
+from app.utils.import_job_utils import (
+    FINISHED_STATUSES,
+    checkpoint_import_job,
+    claim_import_job,
+    count_import_job_attempt,
+    finish_import_job,
+    get_active_import_job_ids,
+    get_import_job,
+    get_import_job_links,
+    import_job_spool_dir,
+    refresh_import_job_claim,
+    release_import_job,
+    store_import_job_links,
+    update_import_job,
+)
+from app.utils.quota_utils import LOW_PRIORITY
+
+logger = get_logger(f"{__name__}")
+
+
+async def _parse_import_files(job: dict) -> Tuple[List[str], int]:
+    """
+    Parse the spooled files of a job into canonical, de-duplicated links.
+    Returns the links and how many distinct links were not YouTube videos.
+    """
+    links = set()
+    for spooled in job["files"]:
+        with open(spooled["path"], "rb") as fh:
+            upload = UploadFile(file=fh, filename=spooled["filename"])
+            async for link in stream_file_links(upload):
+                links.add(link)
+
+    invalid = sum(1 for link in links if not extract_youtube_link_id(link))
+    return list(canonicalize_links(links).values()), invalid
+
+
+async def _import_chunk(user_id: int, urls: List[str]) -> dict:
+    """
+    Insert one chunk of links and return the progress counters it adds.
+    Videos the user already has are checked up front, so no metadata is
+    fetched for them, and skipped again by the insert, which also makes
+    re-running a chunk after a crash harmless.
+    """
+    canonical = canonicalize_links(urls)
+    async with async_session_local() as db:
+        repo = VideoLinkRepository(db)
+        existing = set(await repo.get_existing_video_ids(user_id, list(canonical)))
+        new_urls = [url for vid, url in canonical.items() if vid not in existing]
+
+        payloads = []
+        if new_urls:
+            payloads = await build_link_payloads(new_urls, priority=LOW_PRIORITY)
+
+        # metadata the low-priority budget could not cover is left to the
+        # enrichment worker
+        pending = [
+            item["video_id"]
+            for item in payloads
+            if item.get("enrichment_status") == EnrichmentStatus.PENDING
+        ]
+
+        # the insert also skips videos added concurrently since the check above
+        created = []
+        if payloads:
+            created = await repo.create_video_link(user_id, payloads, source="file")
+
+    await enqueue_video_enrichment(pending)
+    return {
+        "links_duplicate": len(urls) - len(created),
+        "links_enriched": sum(
+            1 for link in created if link.enrichment_status == EnrichmentStatus.ENRICHED
+        ),
+        "links_inserted": len(created),
+    }
+
+
+async def process_import_job(job_id: str):
+    """
+    Run an import job from its last checkpoint: parse the spooled files once,
+    then insert the links in IMPORT_CHUNK_SIZE chunks, checkpointing after each.
+    """
+    job = await get_import_job(job_id)
+    if not job or job["status"] in FINISHED_STATUSES:
+        return
+
+    attempts = await count_import_job_attempt(job_id)
+    if attempts > conf.import_max_attempts:
+        await finish_import_job(
+            job_id, ImportJobStatus.FAILED, "Import failed after repeated attempts"
+        )
+        shutil.rmtree(import_job_spool_dir(job_id), ignore_errors=True)
+        return
+
+    try:
+        if job["status"] in (
+            ImportJobStatus.QUEUED.value,
+            ImportJobStatus.PARSING.value,
+        ):
+            await update_import_job(job_id, status=ImportJobStatus.PARSING.value)
+            links, invalid = await _parse_import_files(job)
+            await store_import_job_links(job_id, links, links_invalid=invalid)
+            job = await get_import_job(job_id)
+
+        processed = job["processed"]
+        while processed < job["links_parsed"]:
+            urls = await get_import_job_links(job_id, processed, conf.import_chunk_size)
+            if not urls:
+                break
+            counters = await _import_chunk(job["user_id"], urls)
+            await checkpoint_import_job(
+                job_id, processed, processed + len(urls), **counters
+            )
+            processed += len(urls)
+
+    except ValueError as e:
+        await finish_import_job(job_id, ImportJobStatus.FAILED, str(e))
+    else:
+        await finish_import_job(job_id, ImportJobStatus.COMPLETED)
+        logger.info("Import job %s completed (%d links)", job_id, processed)
+    finally:
+        await delete_cache(f"user_videos:{job['user_id']}")
+        await mark_recent_write(int(job["user_id"]))
+
+    shutil.rmtree(import_job_spool_dir(job_id), ignore_errors=True)
+
+
+async def _hold_import_job_claim(job_id: str, token: str):
+    """
+    Refresh the job lock every third of IMPORT_LOCK_TTL, so long parses and
+    chunks keep it. Returns once the lock is lost to another worker.
+    """
+    while True:
+        await asyncio.sleep(conf.import_lock_ttl / 3)
+        try:
+            if not await refresh_import_job_claim(job_id, token):
+                logger.warning("Lost the lock of import job %s", job_id)
+                return
+        except Exception as e:
+            logger.error(f"Import job {job_id} lock refresh error: {e}")
+
+
+async def process_claimed_import_job(job_id: str, token: str):
+    """
+    Run `process_import_job` while a heartbeat keeps its lock. If the lock is
+    lost the job is cancelled; the worker now holding it resumes from the last
+    checkpoint.
+    """
+    job_task = asyncio.create_task(process_import_job(job_id))
+    heartbeat = asyncio.create_task(_hold_import_job_claim(job_id, token))
+    try:
+        await asyncio.wait({job_task, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        job_task.cancel()
+        heartbeat.cancel()
+        await asyncio.gather(job_task, heartbeat, return_exceptions=True)
+
+    if not job_task.cancelled():
+        job_task.result()
+
+
+async def run_import_worker():
+    """
+    Process active import jobs until cancelled. Jobs interrupted by a crash or
+    restart are resumed from their checkpoint once their lock expires.
+    """
+    logger.info("Import worker started")
+    while True:
+        try:
+            for job_id in await get_active_import_job_ids():
+                token = await claim_import_job(job_id)
+                if not token:
+                    continue
+                try:
+                    await process_claimed_import_job(job_id, token)
+                finally:
+                    await release_import_job(job_id, token)
+        except asyncio.CancelledError:
+            logger.info("Import worker stopped")
+            raise
+        except Exception as e:
+            logger.error(f"Import worker error: {e}\n{traceback.format_exc()}")
+
+        await asyncio.sleep(conf.import_poll_interval)
@@ -0,0 +1,56 @@
+import asyncio
+import traceback
+
+from app.config import async_session_local, conf, get_logger
+from app.repository import VideoLinkRepository
+from app.utils.progress_utils import pop_dirty_progress, requeue_dirty_progress
+
+logger = get_logger(f"{__name__}")
+
+
+async def flush_progress() -> int:
+    """
+    Write every buffered progress position back to the database, in batches
+    of PROGRESS_FLUSH_BATCH_SIZE. A failed batch is marked dirty again for the
+    next round. Returns the number of positions flushed.
+    """
+    flushed = 0
+    while True:
+        entries = await pop_dirty_progress(conf.progress_flush_batch_size)
+        if not entries:
+            break
+
+        try:
+            async with async_session_local() as db:
+                await VideoLinkRepository(db).update_progress(entries)
+        except Exception:
+            await requeue_dirty_progress(entries)
+            raise
+
+        flushed += len(entries)
+
+    if flushed:
+        logger.info("Flushed %d buffered progress positions", flushed)
+    return flushed
+
+
+async def run_progress_flush_worker():
+    """
+    Run `flush_progress` every PROGRESS_FLUSH_INTERVAL seconds until cancelled,
+    with a last flush on shutdown. SPOP hands each dirty entry to one app worker,
+    so every worker can flush without a lock.
+    """
+    logger.info("Progress flush worker started")
+    while True:
+        try:
+            await asyncio.sleep(conf.progress_flush_interval)
+            await flush_progress()
+        except asyncio.CancelledError:
+            try:
+                await flush_progress()
+            except Exception as e:
+                logger.error(f"Final progress flush error: {e}")
+            logger.info("Progress flush worker stopped")
+            raise
+        except Exception as e:
+            logger.error(f"Progress flush error: {e}\n{traceback.format_exc()}")
@@ -0,0 +1,81 @@
+import asyncio
+import traceback
+from datetime import datetime, timedelta
+
+from app.config import (
+    acquire_lock,
+    async_session_local,
+    conf,
+    get_logger,
+)
+from app.repository import VideoLinkRepository
+from app.utils.api_utils import (
+    YOUTUBE_MAX_IDS_PER_REQUEST,
+    fetch_youtube_video_statistics,
+)
+from app.utils.quota_utils import LOW_PRIORITY, quota_available
+from app.utils.redis_utils import update_cached_video_stats
+
+logger = get_logger(f"{__name__}")
+
+STATS_REFRESH_LOCK = "stats_refresh:lock"
+
+
+async def refresh_video_stats() -> int:
+    """
+    Refresh view/like/comment counts for up to STATS_REFRESH_BATCHES_PER_RUN
+    batches of 50 videos, each costing one quota unit. Stops early when nothing
+    is due or the quota is down to the low-priority reserve. The new counts
+    are written into the cached metadata of videos whose counts changed.
+    Returns the number of videos whose statistics changed.
+    """
+    refreshed_before = datetime.utcnow().replace(tzinfo=None) - timedelta(
+        seconds=conf.stats_refresh_min_age
+    )
+    checked = changed_total = 0
+
+    for _ in range(conf.stats_refresh_batches_per_run):
+        if not await quota_available(priority=LOW_PRIORITY):
+            logger.warning("YouTube quota low, postponing statistics refresh")
+            break
+
+        async with async_session_local() as db:
+            repo = VideoLinkRepository(db)
+            video_ids = await repo.get_videos_due_for_stats_refresh(
+                YOUTUBE_MAX_IDS_PER_REQUEST, refreshed_before
+            )
+            if not video_ids:
+                break
+
+            stats = await fetch_youtube_video_statistics(
+                video_ids, conf.youtube_key, priority=LOW_PRIORITY
+            )
+            changed = await repo.update_video_stats(video_ids, stats)
+
+        await update_cached_video_stats({vid: stats[vid] for vid in changed})
+        checked += len(video_ids)
+        changed_total += len(changed)
+
+    logger.info(
+        "Statistics refresh checked %d videos, %d changed", checked, changed_total
+    )
+    return changed_total
+
+
+async def run_stats_refresh_worker():
+    """
+    Run `refresh_video_stats` every STATS_REFRESH_INTERVAL seconds until
+    cancelled. A Redis lock makes sure only one app worker runs each round.
+    """
+    logger.info("Statistics refresh worker started")
+    while True:
+        try:
+            if await acquire_lock(STATS_REFRESH_LOCK, conf.stats_refresh_interval):
+                await refresh_video_stats()
+        except asyncio.CancelledError:
+            logger.info("Statistics refresh worker stopped")
+            raise
+        except Exception as e:
+            logger.error(f"Statistics refresh error: {e}\n{traceback.format_exc()}")
+
+        await asyncio.sleep(conf.stats_refresh_interval)
@@ -0,0 +1,129 @@
+"""
+EXPLAIN every read query of `VideoLinkRepository` and fail if one of them
+scans a hot table sequentially.
+
+Sequential scans are disabled for the session, so the planner falls back to a
+sequential scan only when no index can serve the query, whatever the table size.
+
+Usage (from the server directory, against a migrated database):
+
+    python -m migrations.check_query_plans
+"""
+
+import asyncio
+import json
+import sys
+
+from sqlalchemy import event, text
+
+from app.authentication.models import User  # noqa: F401  (registers the mapper)
+from app.config import async_session_local
+from app.config.database import engine
+from app.models import PlaylistVisibility
+from app.repository import VideoLinkRepository
+
+HOT_TABLES = {"uploaded_links", "playlist", "videos"}
+
+CHECKS = {
+    "get_links_page": lambda repo, s: repo.get_links_page(s["user_id"], 20),
+    "get_existing_video_ids": lambda repo, s: repo.get_existing_video_ids(
+        s["user_id"], [s["video_id"]]
+    ),
+    "check_unique_video": lambda repo, s: repo.check_unique_video(
+        s["user_id"], s["link_id"], s["playlist_id"]
+    ),
+    "get_user_playlists_with_videos": lambda repo, s: (
+        repo.get_user_playlists_with_videos(s["user_id"])
+    ),
+    "get_all_public_playlist_with_videos": lambda repo, s: (
+        repo.get_all_public_playlist_with_videos("public")
+    ),
+    "get_playlists_page (owner)": lambda repo, s: repo.get_playlists_page(
+        20, user_id=s["user_id"]
+    ),
+    "get_playlists_page (public)": lambda repo, s: repo.get_playlists_page(
+        20, visibility=PlaylistVisibility.PUBLIC
+    ),
+    "get_playlist_previews": lambda repo, s: repo.get_playlist_previews(
+        [s["playlist_id"]], 4
+    ),
+    "get_playlist_videos_page": lambda repo, s: repo.get_playlist_videos_page(
+        s["playlist_id"], 20
+    ),
+    "get_progress_tracker": lambda repo, s: repo.get_progress_tracker(
+        s["user_id"], s["link_id"]
+    ),
+    "get_playlist_progress": lambda repo, s: repo.get_playlist_progress(
+        s["user_id"], s["playlist_id"]
+    ),
+}
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    scans = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in HOT_TABLES:
+        scans.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        scans.extend(_seq_scans(child))
+    return scans
+
+
+async def _sample(db) -> dict:
+    """Pick real ids so eager loads of related rows are exercised too."""
+    row = (
+        await db.execute(
+            text(
+                "SELECT user_id, id, playlist_id, url, video_id FROM uploaded_links "
+                "ORDER BY playlist_id IS NULL LIMIT 1"
+            )
+        )
+    ).first()
+    if not row:
+        return {"user_id": 0, "link_id": 0, "playlist_id": 0, "url": "", "video_id": ""}
+    return {
+        "user_id": row.user_id,
+        "link_id": row.id,
+        "playlist_id": row.playlist_id or 0,
+        "url": row.url,
+        "video_id": row.video_id,
+    }
+
+
+async def check_query_plans() -> bool:
+    captured: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    ok = True
+    async with async_session_local() as db:
+        await db.execute(text("SET LOCAL enable_seqscan = off"))
+        sample = await _sample(db)
+        connection = await db.connection()
+
+        for name, call in CHECKS.items():
+            captured.clear()
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            try:
+                await call(VideoLinkRepository(db), sample)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+            for statement, parameters in captured:
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                scans = _seq_scans(plan[0]["Plan"])
+                status = "SEQ SCAN on " + ", ".join(scans) if scans else "ok"
+                print(f"{name:40} {status}")
+                ok = ok and not scans
+
+        await db.rollback()
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(check_query_plans()) else 1)
@@ -0,0 +1,27 @@
+"""
+Recompute `playlist.total_videos` and `playlist.videos_completed` from
+`uploaded_links`.
+
+The counters are only maintained while PLAYLIST_PROGRESS_COUNTERS is on, so run
+this right after turning the option on (again), once no app worker is still
+writing with it off.
+
+Usage (from the server directory, against a migrated database):
+
+    python -m migrations.recount_playlist_progress
+"""
+
+import asyncio
+
+from app.authentication.models import User  # noqa: F401  (registers the mapper)
+from app.config import async_session_local
+from app.repository import VideoLinkRepository
+
+
+async def recount_playlist_progress() -> int:
+    async with async_session_local() as db:
+        return await VideoLinkRepository(db).recount_playlist_progress()
+
+
+if __name__ == "__main__":
+    print(f"Recounted {asyncio.run(recount_playlist_progress())} playlists")
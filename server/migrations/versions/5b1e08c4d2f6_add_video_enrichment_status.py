@@ -0,0 +1,45 @@
+"""Add video enrichment status
+
+Revision ID: 5b1e08c4d2f6
+Revises: c3f9d2a7b814
+Create Date: 2026-10-18 14:03:52.118640
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e08c4d2f6"
+down_revision: Union[str, Sequence[str], None] = "c3f9d2a7b814"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+enrichment_status = sa.Enum("PENDING", "ENRICHED", "FAILED", name="enrichmentstatus")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    enrichment_status.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        "videos",
+        sa.Column(
+            "enrichment_status",
+            enrichment_status,
+            nullable=False,
+            server_default="PENDING",
+        ),
+    )
+    # Rows that already carry metadata were enriched synchronously at insert time
+    op.execute(
+        "UPDATE videos SET enrichment_status = 'ENRICHED' WHERE title IS NOT NULL"
+    )
+    op.execute("UPDATE videos SET enrichment_status = 'FAILED' WHERE title IS NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("videos", "enrichment_status")
+    enrichment_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,34 @@
+"""Add stats refresh tracking
+
+Revision ID: 9d4a6f31c0e2
+Revises: 5b1e08c4d2f6
+Create Date: 2026-10-18 16:47:09.553012
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4a6f31c0e2"
+down_revision: Union[str, Sequence[str], None] = "5b1e08c4d2f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "videos", sa.Column("stats_refreshed_at", sa.DateTime(), nullable=True)
+    )
+    op.add_column(
+        "uploaded_links", sa.Column("last_watched_at", sa.DateTime(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("uploaded_links", "last_watched_at")
+    op.drop_column("videos", "stats_refreshed_at")
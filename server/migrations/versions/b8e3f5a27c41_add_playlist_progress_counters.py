@@ -0,0 +1,50 @@
+"""Add playlist progress counters
+
+Revision ID: b8e3f5a27c41
+Revises: f4a1d7c3b920
+Create Date: 2026-10-18 21:12:40.318275
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e3f5a27c41"
+down_revision: Union[str, Sequence[str], None] = "f4a1d7c3b920"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "playlist",
+        sa.Column("total_videos", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "playlist",
+        sa.Column("videos_completed", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute("""
+        UPDATE playlist
+        SET total_videos = counts.total_videos,
+            videos_completed = counts.videos_completed
+        FROM (
+            SELECT playlist_id,
+                   count(*) AS total_videos,
+                   count(*) FILTER (WHERE is_completed) AS videos_completed
+            FROM uploaded_links
+            WHERE playlist_id IS NOT NULL
+            GROUP BY playlist_id
+        ) AS counts
+        WHERE playlist.id = counts.playlist_id
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("playlist", "videos_completed")
+    op.drop_column("playlist", "total_videos")
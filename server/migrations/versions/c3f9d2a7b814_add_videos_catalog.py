@@ -0,0 +1,117 @@
+"""Add videos catalog
+
+Revision ID: c3f9d2a7b814
+Revises: a51cd771f418
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f9d2a7b814"
+down_revision: Union[str, Sequence[str], None] = "a51cd771f418"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+METADATA_COLUMNS = (
+    "title",
+    "description",
+    "channel_title",
+    "thumbnail_url",
+    "duration_seconds",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "tags",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "videos",
+        sa.Column("video_id", sa.String(length=11), nullable=False),
+        sa.Column("etag", sa.String(), nullable=True),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("channel_title", sa.String(), nullable=True),
+        sa.Column("thumbnail_url", sa.String(), nullable=True),
+        sa.Column("duration_seconds", sa.Float(), nullable=True),
+        sa.Column("view_count", sa.BigInteger(), nullable=True),
+        sa.Column("like_count", sa.BigInteger(), nullable=True),
+        sa.Column("comment_count", sa.BigInteger(), nullable=True),
+        sa.Column("tags", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("video_id"),
+    )
+
+    # Backfill one catalog row per video, preferring the most recent row that
+    # actually carries metadata.
+    columns = ", ".join(METADATA_COLUMNS)
+    op.execute(f"""
+        INSERT INTO videos (video_id, {columns}, created_at, updated_at)
+        SELECT DISTINCT ON (video_id) video_id, {columns}, now(), now()
+        FROM uploaded_links
+        ORDER BY video_id, (title IS NULL), uploaded_at DESC NULLS LAST, id DESC
+        """)
+
+    op.create_foreign_key(
+        "uploaded_links_video_id_fkey",
+        "uploaded_links",
+        "videos",
+        ["video_id"],
+        ["video_id"],
+    )
+    for column in METADATA_COLUMNS:
+        op.drop_column("uploaded_links", column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("uploaded_links", sa.Column("title", sa.String(), nullable=True))
+    op.add_column("uploaded_links", sa.Column("description", sa.Text(), nullable=True))
+    op.add_column(
+        "uploaded_links", sa.Column("channel_title", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "uploaded_links", sa.Column("thumbnail_url", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "uploaded_links", sa.Column("duration_seconds", sa.Float(), nullable=True)
+    )
+    op.add_column(
+        "uploaded_links", sa.Column("view_count", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "uploaded_links", sa.Column("like_count", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "uploaded_links", sa.Column("comment_count", sa.Integer(), nullable=True)
+    )
+    op.add_column("uploaded_links", sa.Column("tags", sa.Text(), nullable=True))
+
+    assignments = ", ".join(f"{column} = v.{column}" for column in METADATA_COLUMNS)
+    op.execute(f"""
+        UPDATE uploaded_links AS l SET {assignments}
+        FROM videos AS v
+        WHERE v.video_id = l.video_id
+        """)
+    # the catalog stores fractional seconds; the old column was whole seconds
+    op.alter_column(
+        "uploaded_links",
+        "duration_seconds",
+        existing_type=sa.Float(),
+        type_=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using="round(duration_seconds)::integer",
+    )
+
+    op.drop_constraint(
+        "uploaded_links_video_id_fkey", "uploaded_links", type_="foreignkey"
+    )
+    op.drop_table("videos")
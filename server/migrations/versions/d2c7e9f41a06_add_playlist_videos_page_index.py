@@ -0,0 +1,46 @@
+"""Add playlist videos page index
+
+Revision ID: d2c7e9f41a06
+Revises: b8e3f5a27c41
+Create Date: 2026-10-18 23:05:51.742913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2c7e9f41a06"
+down_revision: Union[str, Sequence[str], None] = "b8e3f5a27c41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# get_playlist_videos_page: a playlist's videos ordered by (uploaded_at, id)
+INDEX_NAME = "ix_uploaded_links_playlist_uploaded_at"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # built concurrently so writes to uploaded_links are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "uploaded_links",
+            ["playlist_id", "uploaded_at", "id"],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("playlist_id IS NOT NULL"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="uploaded_links",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
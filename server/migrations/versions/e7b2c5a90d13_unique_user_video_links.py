@@ -0,0 +1,59 @@
+"""Unique user video links
+
+Revision ID: e7b2c5a90d13
+Revises: 9d4a6f31c0e2
+Create Date: 2026-10-18 18:02:41.207719
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b2c5a90d13"
+down_revision: Union[str, Sequence[str], None] = "9d4a6f31c0e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep the oldest link per (user_id, video_id), carrying over the furthest
+    # watch progress and a playlist membership from the duplicates
+    op.execute("""
+        UPDATE uploaded_links AS keep
+        SET is_completed = dup.is_completed,
+            last_watched_time = dup.last_watched_time,
+            last_watched_at = dup.last_watched_at,
+            playlist_id = COALESCE(keep.playlist_id, dup.playlist_id)
+        FROM (
+            SELECT min(id) AS keep_id,
+                   bool_or(COALESCE(is_completed, false)) AS is_completed,
+                   max(last_watched_time) AS last_watched_time,
+                   max(last_watched_at) AS last_watched_at,
+                   min(playlist_id) AS playlist_id
+            FROM uploaded_links
+            GROUP BY user_id, video_id
+            HAVING count(*) > 1
+        ) AS dup
+        WHERE keep.id = dup.keep_id
+        """)
+    op.execute("""
+        DELETE FROM uploaded_links AS extra
+        USING uploaded_links AS keep
+        WHERE extra.user_id = keep.user_id
+          AND extra.video_id = keep.video_id
+          AND extra.id > keep.id
+        """)
+    op.create_index(
+        "uq_uploaded_links_user_video",
+        "uploaded_links",
+        ["user_id", "video_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_uploaded_links_user_video", table_name="uploaded_links")
@@ -0,0 +1,73 @@
+"""Add hot path indexes
+
+Revision ID: f4a1d7c3b920
+Revises: e7b2c5a90d13
+Create Date: 2026-10-18 18:40:12.386104
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a1d7c3b920"
+down_revision: Union[str, Sequence[str], None] = "e7b2c5a90d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    # get_links_page: a user's library ordered by upload time
+    (
+        "ix_uploaded_links_user_uploaded_at",
+        "uploaded_links",
+        ["user_id", "uploaded_at", "id"],
+        None,
+    ),
+    # playlist videos (selectinload by playlist_id) and check_unique_video
+    (
+        "ix_uploaded_links_playlist_user",
+        "uploaded_links",
+        ["playlist_id", "user_id"],
+        "playlist_id IS NOT NULL",
+    ),
+    # get_user_playlists_with_videos and get_playlists_page by owner
+    ("ix_playlist_user_id", "playlist", ["user_id", "id"], None),
+    # the public playlist feed
+    (
+        "ix_playlist_public_created_at",
+        "playlist",
+        ["created_at", "id"],
+        "visibility = 'PUBLIC'",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction and does not
+    # block writes to the table while the index builds
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,100 @@
+import importlib
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.authentication.jwt.oauth2 import get_current_user
+from app.config import get_db
+from app.config.server import app
+from app.models import EnrichmentStatus, UploadedLinks, Video
+from app.repository import VideoLinkRepository
+
+video_link = importlib.import_module("app.api.v1.video_link")
+
+VIDEO_ID = "dQw4w9WgXcQ"
+UPLOADED_AT = datetime(2026, 1, 1, 12, 0)
+
+
+class FakeSession:
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def noop(*args, **kwargs):
+        return None
+
+    for name in (
+        "delete_cache",
+        "enqueue_video_enrichment",
+        "get_cached_upload_links",
+        "set_cached_upload_links",
+    ):
+        monkeypatch.setattr(video_link, name, noop)
+
+    async def create_video_link(self, user_id, links, source):
+        created = []
+        for index, data in enumerate(links, start=1):
+            link = UploadedLinks(
+                id=index,
+                url=data["url"],
+                video_id=data["video_id"],
+                source=source,
+                user_id=user_id,
+                uploaded_at=UPLOADED_AT,
+            )
+            link.video = Video(
+                video_id=data["video_id"], enrichment_status=data["enrichment_status"]
+            )
+            created.append(link)
+        return created
+
+    async def upsert_videos(self, videos):
+        return {video["video_id"]: video for video in videos}
+
+    async def get_video_metadata(video_ids, **kwargs):
+        return {
+            vid: {"video_id": vid, "title": "Never Gonna Give You Up"}
+            for vid in video_ids
+        }, []
+
+    async def get_db_override():
+        yield FakeSession()
+
+    monkeypatch.setattr(VideoLinkRepository, "create_video_link", create_video_link)
+    monkeypatch.setattr(VideoLinkRepository, "upsert_videos", upsert_videos)
+    monkeypatch.setattr(video_link, "get_video_metadata", get_video_metadata)
+    app.dependency_overrides[get_db] = get_db_override
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+        id=1, email="user@example.com"
+    )
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_upload_file_returns_created_links(client):
+    response = client.post(
+        "/api/v1/video-links/files",
+        files={
+            "files": (
+                "links.txt",
+                f"https://www.youtube.com/watch?v={VIDEO_ID}\n",
+                "text/plain",
+            )
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["source"] == "file"
+    assert len(body["links"]) == 1
+    link = body["links"][0]
+    assert link["url"] == f"https://www.youtube.com/watch?v={VIDEO_ID}"
+    assert link["metadata"]["title"] == "Never Gonna Give You Up"
+    assert link["metadata"]["uploaded_at"] == UPLOADED_AT.isoformat()